@@ -1,9 +1,32 @@
 # Interview Preparation Agent package
-from .conversation_state import ConversationState, ConversationPhase, UserInputs
-from .web_search_tools import WebSearchManager
-from .interview_prep_agent import InterviewPrepAgent
-from .interview_prep_executor import InterviewPrepAgentExecutor
-from .push_notification_handler import InterviewPrepPushNotificationHandler
+import importlib
+
+# Public names are resolved lazily (PEP 562) so importing the package, e.g.
+# for `python -m app`, does not pull in LangChain and the search stack up front.
+_LAZY = {
+    'ConversationState': ('.conversation_state', 'ConversationState'),
+    'ConversationPhase': ('.conversation_state', 'ConversationPhase'),
+    'UserInputs': ('.conversation_state', 'UserInputs'),
+    'WebSearchManager': ('.web_search_tools', 'WebSearchManager'),
+    'InterviewPrepAgent': ('.interview_prep_agent', 'InterviewPrepAgent'),
+    'InterviewPrepAgentExecutor': ('.interview_prep_executor', 'InterviewPrepAgentExecutor'),
+    'InterviewPrepPushNotificationHandler': ('.push_notification_handler', 'InterviewPrepPushNotificationHandler'),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     'ConversationState',
@@ -13,4 +36,4 @@ __all__ = [
     'InterviewPrepAgent',
     'InterviewPrepAgentExecutor',
     'InterviewPrepPushNotificationHandler'
-]
\ No newline at end of file
+]
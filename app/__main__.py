@@ -1,26 +1,44 @@
 import sys
 import os
 import logging
-
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, fields
+from typing import Optional
+
+import anyio.to_thread
 import click
+import orjson
 import uvicorn
 import httpx
 
 from a2a.server.apps import A2AStarletteApplication
 from a2a.server.request_handlers import DefaultRequestHandler
-from a2a.server.tasks import BasePushNotificationSender, InMemoryTaskStore, InMemoryPushNotificationConfigStore
 from a2a.types import (
     AgentCapabilities,
     AgentCard,
     AgentSkill,
 )
+from a2a.utils import AGENT_CARD_WELL_KNOWN_PATH, PREV_AGENT_CARD_WELL_KNOWN_PATH
 from dotenv import load_dotenv
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+# Load environment variables before the app modules, some of which read
+# settings at import time
+load_dotenv()
 
 from .interview_prep_executor import InterviewPrepAgentExecutor
 from .interview_prep_agent import InterviewPrepAgent
-
-# Load environment variables
-load_dotenv()
+from .push_notification_handler import (
+    BatchingPushNotificationSender,
+    InterviewPrepPushNotificationHandler,
+)
+from .stores import LRUPushNotificationConfigStore, LRUTaskStore
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -30,65 +48,187 @@ class MissingAPIKeyError(Exception):
     """Exception for missing API key."""
 
 
+def _env_flag(name: str, default: str = 'true') -> bool:
+    return os.getenv(name, default).lower() == 'true'
+
+
+@dataclass(frozen=True)
+class ServerSettings:
+    """Snapshot of the server's environment configuration, read once at startup."""
+    google_api_key: Optional[str]
+    enable_web_search: bool
+    enable_push_notifications: bool
+    base_api_url: str
+    processing_delay_seconds: int
+    callback_timeout_seconds: int
+    uvicorn_limit_concurrency: int
+    uvicorn_keepalive: int
+    anyio_threadpool: int
+    push_max_connections: int
+    push_expected_subscribers: int
+
+    @classmethod
+    def from_env(cls) -> 'ServerSettings':
+        return cls(
+            google_api_key=os.getenv('GOOGLE_API_KEY') or None,
+            enable_web_search=_env_flag('ENABLE_WEB_SEARCH'),
+            enable_push_notifications=_env_flag('ENABLE_PUSH_NOTIFICATIONS'),
+            base_api_url=os.getenv('BASE_API_URL', 'http://localhost:8000'),
+            processing_delay_seconds=int(os.getenv('PROCESSING_DELAY_SECONDS', '5')),
+            callback_timeout_seconds=int(os.getenv('CALLBACK_TIMEOUT_SECONDS', '60')),
+            uvicorn_limit_concurrency=int(os.getenv('UVICORN_LIMIT_CONCURRENCY', '1024')),
+            uvicorn_keepalive=int(os.getenv('UVICORN_KEEPALIVE', '30')),
+            anyio_threadpool=int(os.getenv('ANYIO_THREADPOOL', '200')),
+            push_max_connections=int(os.getenv('PUSH_MAX_CONNECTIONS', '1000')),
+            push_expected_subscribers=int(os.getenv('PUSH_EXPECTED_SUBSCRIBERS', '100')),
+        )
+
+
+SETTINGS = ServerSettings.from_env()
+
+
+# Agent capabilities and skills do not depend on host/port, so build them once
+CAPABILITIES = AgentCapabilities(
+    streaming=True,
+    pushNotifications=True
+)
+
+SKILLS = [
+    AgentSkill(
+        id='interview_preparation',
+        name='Interview Preparation Planning',
+        description='Creates personalized interview preparation plans with multi-turn conversation',
+        tags=['interview', 'preparation', 'career', 'coaching', 'personalized'],
+        examples=[
+            'I want to prepare for software engineering interviews',
+            'Help me get ready for algorithms and system design interviews',
+            'Create a study plan for technical interviews at FAANG companies'
+        ]
+    ),
+    AgentSkill(
+        id='domain_specific_prep',
+        name='Domain-Specific Interview Guidance',
+        description='Provides targeted preparation for specific interview domains',
+        tags=['algorithms', 'system_design', 'databases', 'machine_learning'],
+        examples=[
+            'I need help with system design interviews',
+            'Focus on machine learning interview preparation',
+            'Help me with database and SQL interview questions'
+        ]
+    ),
+    AgentSkill(
+        id='company_research',
+        name='Company-Specific Interview Research',
+        description='Researches interview patterns and preparation for specific companies',
+        tags=['company_research', 'interview_patterns', 'targeted_prep'],
+        examples=[
+            'Help me prepare for interviews at Google',
+            'What should I expect in Amazon interviews?',
+            'Research interview process for startup companies'
+        ]
+    )
+]
+
+
+def create_httpx_client() -> httpx.AsyncClient:
+    """Create the shared outbound HTTP client.
+
+    The pool is sized so concurrent callbacks and API calls reuse warm
+    (HTTP/2 where available) connections instead of re-handshaking. Push
+    deliveries dominate outbound traffic, so keep-alive slots scale with the
+    expected number of webhook subscribers.
+    """
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=SETTINGS.push_max_connections,
+            max_keepalive_connections=max(100, SETTINGS.push_expected_subscribers),
+            keepalive_expiry=60,
+        ),
+        http2=True,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        headers={'User-Agent': 'InterviewPrepAgent/1.0'},
+    )
+
+
+@functools.cache
+def _components():
+    """Process-wide HTTP client and stores shared by main() and create_test_client()."""
+    return {
+        'httpx_client': create_httpx_client(),
+        'task_store': LRUTaskStore(),
+        'push_config_store': LRUPushNotificationConfigStore(),
+    }
+
+
+def add_static_agent_card_routes(app: Starlette, agent_card: AgentCard) -> None:
+    """Serve the agent card from bytes serialized once at startup.
+
+    The card never changes after startup, so the routes are inserted ahead of
+    the SDK's handlers, which re-dump the model on every request.
+    """
+    body = orjson.dumps(agent_card.model_dump(mode='json', exclude_none=True, by_alias=True))
+
+    async def agent_card_endpoint(request: Request) -> Response:
+        return Response(body, media_type='application/json')
+
+    for path in (PREV_AGENT_CARD_WELL_KNOWN_PATH, AGENT_CARD_WELL_KNOWN_PATH):
+        app.router.routes.insert(0, Route(path, agent_card_endpoint, methods=['GET']))
+
+
+def create_lifespan(
+    httpx_client: httpx.AsyncClient,
+    push_sender: Optional[BatchingPushNotificationSender] = None,
+    push_handler: Optional[InterviewPrepPushNotificationHandler] = None,
+):
+    """Create a Starlette lifespan that sizes the worker thread pool on startup,
+    and on shutdown flushes buffered push notifications and closes the shared
+    clients."""
+
+    @asynccontextmanager
+    async def lifespan(app):
+        # anyio defaults to 40 threads for sync work offloaded from the loop
+        limiter = anyio.to_thread.current_default_thread_limiter()
+        limiter.total_tokens = SETTINGS.anyio_threadpool
+        # asyncio.to_thread runs on the loop's default executor, which is
+        # otherwise capped at min(32, cpu_count + 4) workers
+        executor = ThreadPoolExecutor(max_workers=SETTINGS.anyio_threadpool)
+        asyncio.get_running_loop().set_default_executor(executor)
+        try:
+            yield
+        finally:
+            if push_sender is not None:
+                await push_sender.aclose()
+            if push_handler is not None:
+                await push_handler.aclose()
+            await httpx_client.aclose()
+            executor.shutdown(wait=False)
+
+    return lifespan
+
+
 @click.command()
 @click.option('--host', 'host', default='localhost')
 @click.option('--port', 'port', default=10001)
-def main(host, port):
+@click.option(
+    '--limit-concurrency',
+    'limit_concurrency',
+    default=SETTINGS.uvicorn_limit_concurrency,
+    type=int,
+    help='Maximum concurrent connections before uvicorn answers with 503.',
+)
+def main(host, port, limit_concurrency):
     """Starts the Interview Preparation Agent server."""
     try:
         # Validate Google API key
-        if not os.getenv('GOOGLE_API_KEY'):
+        if not SETTINGS.google_api_key:
             raise MissingAPIKeyError(
                 'GOOGLE_API_KEY environment variable not set.'
             )
 
         logger.info("Starting Interview Preparation Agent server")
-        logger.info(f"Google API Key configured: {'Yes' if os.getenv('GOOGLE_API_KEY') else 'No'}")
-        logger.info(f"Web search enabled: {os.getenv('ENABLE_WEB_SEARCH', 'true')}")
-        logger.info(f"Push notifications enabled: {os.getenv('ENABLE_PUSH_NOTIFICATIONS', 'true')}")
-
-        # Define agent capabilities
-        capabilities = AgentCapabilities(
-            streaming=True,
-            pushNotifications=True
-        )
-
-        # Define agent skills
-        skills = [
-            AgentSkill(
-                id='interview_preparation',
-                name='Interview Preparation Planning',
-                description='Creates personalized interview preparation plans with multi-turn conversation',
-                tags=['interview', 'preparation', 'career', 'coaching', 'personalized'],
-                examples=[
-                    'I want to prepare for software engineering interviews',
-                    'Help me get ready for algorithms and system design interviews',
-                    'Create a study plan for technical interviews at FAANG companies'
-                ]
-            ),
-            AgentSkill(
-                id='domain_specific_prep',
-                name='Domain-Specific Interview Guidance',
-                description='Provides targeted preparation for specific interview domains',
-                tags=['algorithms', 'system_design', 'databases', 'machine_learning'],
-                examples=[
-                    'I need help with system design interviews',
-                    'Focus on machine learning interview preparation',
-                    'Help me with database and SQL interview questions'
-                ]
-            ),
-            AgentSkill(
-                id='company_research',
-                name='Company-Specific Interview Research',
-                description='Researches interview patterns and preparation for specific companies',
-                tags=['company_research', 'interview_patterns', 'targeted_prep'],
-                examples=[
-                    'Help me prepare for interviews at Google',
-                    'What should I expect in Amazon interviews?',
-                    'Research interview process for startup companies'
-                ]
-            )
-        ]
+        logger.info("Google API Key configured: %s", 'Yes' if SETTINGS.google_api_key else 'No')
+        logger.info("Web search enabled: %s", SETTINGS.enable_web_search)
+        logger.info("Push notifications enabled: %s", SETTINGS.enable_push_notifications)
 
         # Create agent card
         agent_card = AgentCard(
@@ -98,23 +238,24 @@ def main(host, port):
             version='1.0.0',
             defaultInputModes=InterviewPrepAgent.SUPPORTED_CONTENT_TYPES,
             defaultOutputModes=InterviewPrepAgent.SUPPORTED_CONTENT_TYPES,
-            capabilities=capabilities,
-            skills=skills,
+            capabilities=CAPABILITIES,
+            skills=SKILLS,
         )
 
-        # Initialize HTTP client
-        httpx_client = httpx.AsyncClient()
-
-        # Initialize stores
-        push_config_store = InMemoryPushNotificationConfigStore()
-        task_store = InMemoryTaskStore()
+        # Shared HTTP client and stores
+        components = _components()
+        httpx_client = components['httpx_client']
+        push_config_store = components['push_config_store']
+        task_store = components['task_store']
 
         # Create request handler with interview prep executor
+        push_sender = BatchingPushNotificationSender(httpx_client, push_config_store)
+        agent_executor = InterviewPrepAgentExecutor(httpx_client)
         request_handler = DefaultRequestHandler(
-            agent_executor=InterviewPrepAgentExecutor(httpx_client),
+            agent_executor=agent_executor,
             task_store=task_store,
             push_config_store=push_config_store,
-            push_sender=BasePushNotificationSender(httpx_client, push_config_store),
+            push_sender=push_sender,
         )
 
         # Create and configure the server
@@ -123,21 +264,41 @@ def main(host, port):
             http_handler=request_handler
         )
 
-        logger.info(f"Interview Preparation Agent server starting on http://{host}:{port}")
-        logger.info("Agent capabilities:")
-        logger.info(f"  - Streaming: {capabilities.streaming}")
-        logger.info(f"  - Push Notifications: {capabilities.push_notifications}")
-        logger.info(f"  - Skills: {len(skills)}")
-
-        # Start the server
-        uvicorn.run(server.build(), host=host, port=port)
+        logger.info("Interview Preparation Agent server starting on http://%s:%s", host, port)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Agent capabilities:")
+            logger.info("  - Streaming: %s", CAPABILITIES.streaming)
+            logger.info("  - Push Notifications: %s", CAPABILITIES.push_notifications)
+            logger.info("  - Skills: %d", len(SKILLS))
+
+        # Start the server (uvloop is not available on Windows)
+        app = server.build(lifespan=create_lifespan(
+            httpx_client, push_sender, agent_executor.push_notification_handler
+        ))
+        add_static_agent_card_routes(app, agent_card)
+
+        config = uvicorn.Config(
+            app=app,
+            host=host,
+            port=port,
+            loop='asyncio' if sys.platform == 'win32' else 'uvloop',
+            http='httptools',
+            limit_concurrency=limit_concurrency,
+            backlog=2048,
+            timeout_keep_alive=SETTINGS.uvicorn_keepalive,
+        )
+        try:
+            uvicorn.Server(config).run()
+        except KeyboardInterrupt:
+            # uvicorn re-raises the signal after a graceful shutdown
+            pass
 
     except MissingAPIKeyError as e:
-        logger.error(f'Error: {e}')
+        logger.error('Error: %s', e)
         logger.error('Please set your GOOGLE_API_KEY in the environment or .env file')
         sys.exit(1)
     except Exception as e:
-        logger.error(f'An error occurred during server startup: {e}')
+        logger.error('An error occurred during server startup: %s', e)
         sys.exit(1)
 
 
@@ -151,15 +312,14 @@ def create_test_client():
     """Create a test client for the Interview Preparation Agent."""
     try:
         # Ensure required environment variables are set
-        if not os.getenv('GOOGLE_API_KEY'):
+        if not SETTINGS.google_api_key:
             logger.warning("GOOGLE_API_KEY not set. Some functionality may not work.")
 
-        # Create HTTP client
-        httpx_client = httpx.AsyncClient()
-
-        # Create stores
-        push_config_store = InMemoryPushNotificationConfigStore()
-        task_store = InMemoryTaskStore()
+        # Reuse the process-wide HTTP client and stores
+        components = _components()
+        httpx_client = components['httpx_client']
+        push_config_store = components['push_config_store']
+        task_store = components['task_store']
 
         # Create agent executor
         agent_executor = InterviewPrepAgentExecutor(httpx_client)
@@ -172,36 +332,22 @@ def create_test_client():
         }
 
     except Exception as e:
-        logger.error(f"Error creating test client: {e}")
+        logger.error("Error creating test client: %s", e)
         return None
 
 
 def validate_environment():
     """Validate that all required environment variables are set."""
-    required_vars = ['GOOGLE_API_KEY']
-    optional_vars = {
-        'ENABLE_WEB_SEARCH': 'true',
-        'ENABLE_PUSH_NOTIFICATIONS': 'true',
-        'BASE_API_URL': 'http://localhost:8000',
-        'PROCESSING_DELAY_SECONDS': '5',
-        'CALLBACK_TIMEOUT_SECONDS': '60'
-    }
-
-    missing_required = []
-    for var in required_vars:
-        if not os.getenv(var):
-            missing_required.append(var)
-
-    if missing_required:
-        logger.error(f"Missing required environment variables: {', '.join(missing_required)}")
+    if not SETTINGS.google_api_key:
+        logger.error("Missing required environment variables: GOOGLE_API_KEY")
         logger.error("Please set these variables in your .env file or environment")
         return False
 
     # Log optional variables
     logger.info("Environment configuration:")
-    for var, default in optional_vars.items():
-        value = os.getenv(var, default)
-        logger.info(f"  {var}: {value}")
+    for field in fields(SETTINGS):
+        if field.name != 'google_api_key':
+            logger.info("  %s: %s", field.name.upper(), getattr(SETTINGS, field.name))
 
     return True
 
@@ -209,8 +355,11 @@ def validate_environment():
 # Export key components for testing
 __all__ = [
     'main',
+    'create_httpx_client',
     'create_test_client',
     'validate_environment',
+    'ServerSettings',
+    'SETTINGS',
     'InterviewPrepAgentExecutor',
     'InterviewPrepAgent'
 ]
\ No newline at end of file
@@ -1,6 +1,25 @@
+import os
+import sys
+from collections import deque
 from enum import Enum
-from typing import Dict, Any, Optional, List
-from pydantic import BaseModel
+from types import MappingProxyType, SimpleNamespace
+from typing import Deque, Dict, Any, Literal, Optional, List
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+
+# Shared config for the per-turn state models: reject unknown fields, store
+# plain enum values and never re-validate on attribute assignment.
+_STATE_MODEL_CONFIG = ConfigDict(extra='forbid', validate_assignment=False, use_enum_values=True)
+
+# Per-conversation history bounds: MAX_HISTORY caps the ring buffer, and once a
+# conversation completes only the last WARM_HISTORY entries are kept.
+MAX_HISTORY = int(os.getenv("MAX_HISTORY", "200"))
+WARM_HISTORY = int(os.getenv("WARM_HISTORY", "20"))
+_HISTORY_COLUMNS = ("msg_roles", "msg_contents", "msg_phases")
+
+
+def _history_column() -> Deque[str]:
+    return deque(maxlen=MAX_HISTORY)
 
 
 class ConversationPhase(str, Enum):
@@ -18,6 +37,25 @@ class ConversationPhase(str, Enum):
     COMPLETED = "completed"                         # Final completion
 
 
+# ConversationState.phase holds the plain string value of a ConversationPhase
+PhaseName = Literal[
+    "initial",
+    "domain_selection",
+    "level_assessment",
+    "preference_gathering",
+    "ready_to_process",
+    "processing_confirmation",
+    "async_processing",
+    "plan_delivered",
+    "refinement_input",
+    "refinement_processing",
+    "completed",
+]
+
+# Interned phase strings, so state checks read PHASE.INITIAL but compare str to str
+PHASE = SimpleNamespace(**{phase.name: sys.intern(phase.value) for phase in ConversationPhase})
+
+
 class InterviewDomain(str, Enum):
     """Available interview domains."""
     ALGORITHMS = "algorithms"
@@ -44,61 +82,148 @@ class PrepPreference(str, Enum):
     PROJECT_BASED = "project_based"
 
 
+# Display titles for the domain, skill level and preference values,
+# e.g. "system_design" -> "System Design"
+DISPLAY_NAMES = MappingProxyType({
+    member.value: member.value.replace('_', ' ').title()
+    for enum in (InterviewDomain, SkillLevel, PrepPreference)
+    for member in enum
+})
+
+
+def display_name(value: str) -> str:
+    """Human-readable title for a domain, skill level or preference value."""
+    name = DISPLAY_NAMES.get(value)
+    return name if name is not None else value.replace('_', ' ').title()
+
+
+# Completion bits for the required inputs, keyed by UserInputs field name
+_COMPLETION_BITS = {"domains": 0b001, "skill_level": 0b010, "preference": 0b100}
+_ALL_INPUTS_MASK = 0b111
+
+# Missing-input labels for every completion mask, in prompt order
+_MISSING_INPUTS = tuple(
+    tuple(
+        label for bit, label in (
+            (0b001, "interview domains"),
+            (0b010, "skill level"),
+            (0b100, "preparation preference"),
+        )
+        if not mask & bit
+    )
+    for mask in range(_ALL_INPUTS_MASK + 1)
+)
+
+
 class UserInputs(BaseModel):
     """Collected user inputs during conversation."""
-    domains: List[InterviewDomain] = []
+    model_config = _STATE_MODEL_CONFIG
+
+    domains: List[InterviewDomain] = Field(default_factory=list)
     skill_level: Optional[SkillLevel] = None
     preference: Optional[PrepPreference] = None
     target_role: Optional[str] = None
     timeline: Optional[str] = None
-    specific_companies: List[str] = []
-    additional_requirements: List[str] = []
+    specific_companies: List[str] = Field(default_factory=list)
+    additional_requirements: List[str] = Field(default_factory=list)
+
+    # Bitmask of the required inputs collected so far, kept in sync on assignment
+    _completion_mask: int = PrivateAttr(default=0)
+    # Rendered domain titles, dropped whenever domains is reassigned
+    _domains_display: Optional[str] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        mask = 0
+        for name, bit in _COMPLETION_BITS.items():
+            if getattr(self, name):
+                mask |= bit
+        self._completion_mask = mask
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        bit = _COMPLETION_BITS.get(name)
+        if bit is not None:
+            if value:
+                self._completion_mask |= bit
+            else:
+                self._completion_mask &= ~bit
+            if name == "domains":
+                self._domains_display = None
+
+    @property
+    def domains_display(self) -> str:
+        """Comma-separated domain titles, e.g. "Algorithms, System Design"."""
+        if self._domains_display is None:
+            self._domains_display = ", ".join([display_name(domain) for domain in self.domains])
+        return self._domains_display
 
 
 class ConversationState(BaseModel):
     """State management for multi-turn conversation."""
-    phase: ConversationPhase = ConversationPhase.INITIAL
-    user_inputs: UserInputs = UserInputs()
-    messages_history: List[Dict[str, Any]] = []
-    processing_steps: List[str] = []
+    model_config = _STATE_MODEL_CONFIG
+
+    phase: PhaseName = PHASE.INITIAL
+    user_inputs: UserInputs = Field(default_factory=UserInputs)
+    # Message history is stored column-wise in bounded ring buffers; see the
+    # messages_history property
+    msg_roles: Deque[str] = Field(default_factory=_history_column)
+    msg_contents: Deque[str] = Field(default_factory=_history_column)
+    msg_phases: Deque[str] = Field(default_factory=_history_column)
+    processing_steps: List[str] = Field(default_factory=list)
     current_processing_step: Optional[str] = None
-    research_data: Dict[str, Any] = {}
+    research_data: Dict[str, Any] = Field(default_factory=dict)
     plan_generated: bool = False
     awaiting_processing_confirmation: bool = False  # NEW: Waiting for user to confirm processing
     plan_content: Optional[str] = None              # NEW: Store generated plan
-    refinement_requests: List[str] = []             # NEW: Store user refinement requests
+    refinement_requests: List[str] = Field(default_factory=list)  # NEW: Store user refinement requests
     satisfaction_confirmed: bool = False            # NEW: User satisfaction status
 
+    def model_post_init(self, __context: Any) -> None:
+        # Validated input is an equal but distinct string; keep phases interned
+        self.phase = sys.intern(self.phase)
+        # Validated input arrives as an unbounded deque; restore the cap
+        for name in _HISTORY_COLUMNS:
+            column = getattr(self, name)
+            if column.maxlen != MAX_HISTORY:
+                setattr(self, name, deque(column, maxlen=MAX_HISTORY))
+
+    @property
+    def messages_history(self) -> List[Dict[str, Any]]:
+        """Conversation history as a list of role/content/phase dicts."""
+        return [
+            {"role": role, "content": content, "phase": phase}
+            for role, content, phase in zip(self.msg_roles, self.msg_contents, self.msg_phases)
+        ]
+
     def add_message(self, role: str, content: str) -> None:
         """Add a message to the conversation history."""
-        self.messages_history.append({
-            "role": role,
-            "content": content,
-            "phase": self.phase
-        })
+        self.msg_roles.append(role)
+        self.msg_contents.append(content)
+        self.msg_phases.append(self.phase)
 
-    def advance_phase(self, new_phase: ConversationPhase) -> None:
+    def advance_phase(self, new_phase: PhaseName) -> None:
         """Advance to the next conversation phase."""
-        self.phase = new_phase
+        self.phase = sys.intern(ConversationPhase(new_phase).value)
+        if self.phase == PHASE.COMPLETED:
+            self._evict_history()
+
+    def _evict_history(self) -> None:
+        """Drop the earlier-phase history in one batch, keeping a warm tail."""
+        excess = len(self.msg_roles) - WARM_HISTORY
+        if excess <= 0:
+            return
+        for name in _HISTORY_COLUMNS:
+            column = getattr(self, name)
+            for _ in range(excess):
+                column.popleft()
 
     def is_input_complete(self) -> bool:
         """Check if all required inputs have been collected."""
-        return (
-            len(self.user_inputs.domains) > 0 and
-            self.user_inputs.skill_level is not None and
-            self.user_inputs.preference is not None
-        )
+        return self.user_inputs._completion_mask == _ALL_INPUTS_MASK
 
     def get_missing_inputs(self) -> List[str]:
         """Get list of missing required inputs."""
-        missing = []
-        if not self.user_inputs.domains:
-            missing.append("interview domains")
-        if not self.user_inputs.skill_level:
-            missing.append("skill level")
-        if not self.user_inputs.preference:
-            missing.append("preparation preference")
-        return missing
+        return list(_MISSING_INPUTS[self.user_inputs._completion_mask])
 
     def add_processing_step(self, step: str) -> None:
         """Add a processing step for progress tracking."""
@@ -116,11 +241,13 @@ class ResponseStatus(str, Enum):
 
 class InterviewPrepResponse(BaseModel):
     """Structured response format for the interview prep agent."""
+    model_config = _STATE_MODEL_CONFIG
+
     status: ResponseStatus
     message: str
-    phase: ConversationPhase
+    phase: PhaseName
     collected_inputs: Optional[Dict[str, Any]] = None
     progress_info: Optional[Dict[str, Any]] = None
     next_question: Optional[str] = None
     requires_web_search: bool = False
-    search_queries: List[str] = []
\ No newline at end of file
+    search_queries: List[str] = Field(default_factory=list)
\ No newline at end of file
@@ -1,28 +1,23 @@
-import os
 import asyncio
+import os
+import re
 import logging
-from typing import Dict, Any, AsyncIterable, List, Optional
-from collections.abc import AsyncIterable as AsyncIterableType
-from pydantic import BaseModel
-from typing import Annotated, Literal
-import operator
-
-from langchain_core.messages import AIMessage, ToolMessage, HumanMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langgraph.checkpoint.memory import MemorySaver
-from langgraph.prebuilt import create_react_agent
-from langgraph.graph import StateGraph, START, END
-from langgraph.graph.message import add_messages
-from typing_extensions import TypedDict
+from typing import TYPE_CHECKING, Dict, Any, List, Literal, Optional
+from collections.abc import AsyncIterable as AsyncIterableType, Iterable, Iterator
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from itertools import islice
+
+from cachetools import LRUCache, TTLCache
+from typing_extensions import NotRequired, TypedDict
+
+if TYPE_CHECKING:
+    from langgraph.checkpoint.memory import MemorySaver
 
 from .conversation_state import (
     ConversationState,
-    ConversationPhase,
-    InterviewPrepResponse,
-    ResponseStatus,
-    InterviewDomain,
-    SkillLevel,
-    PrepPreference,
+    PHASE,
+    display_name,
     UserInputs
 )
 from .web_search_tools import (
@@ -34,24 +29,309 @@ from .web_search_tools import (
     search_current_interview_guides,
     WebSearchManager
 )
+from .serialization import packb, unpackb
 
 logger = logging.getLogger(__name__)
 
+_ALL_DOMAINS = ('algorithms', 'system_design', 'databases', 'machine_learning', 'behavioral', 'frontend', 'backend')
+
+# Domain keywords, in the order domains are reported back to the user
+_DOMAIN_KEYWORDS = {
+    'algorithms': ('algorithm', 'algo', 'dsa', 'leetcode'),
+    'system_design': ('system design', 'systems design', 'system architecture', 'distributed system'),
+    'databases': ('database', 'db', 'sql'),
+    'machine_learning': ('machine learning', 'ml', 'data science'),
+    'behavioral': ('behavioral', 'behavior', 'soft skill'),
+    'frontend': ('frontend', 'front-end', 'react', 'javascript', 'ui/ux'),
+    'backend': ('backend', 'back-end', 'server', 'microservice')
+}
+_KEYWORD_DOMAIN = {keyword: domain for domain, keywords in _DOMAIN_KEYWORDS.items() for keyword in keywords}
+
+# One pass over the input finds every keyword occurrence; the lookahead lets
+# matches overlap, so this is equivalent to a substring test per keyword
+_DOMAIN_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(k) for k in sorted(_KEYWORD_DOMAIN, key=len, reverse=True)) + '))'
+)
 
-class InterviewPrepResponseFormat(BaseModel):
-    """Response format for the interview prep agent."""
-    status: Literal['input_required', 'processing', 'completed', 'error'] = 'input_required'
-    message: str
-    phase: str = 'initial'
-    collected_inputs: Optional[Dict[str, Any]] = None
-    trigger_push_notification: bool = False
+_ALL_RE = re.compile(r'\ball\b|everything')
+
+# Skill levels and preferences, checked in priority order
+_SKILL_LEVEL_PATTERNS = (
+    ('beginner', re.compile('beginner|new|start')),
+    ('intermediate', re.compile('intermediate|some experience|mid')),
+    ('advanced', re.compile('advanced|expert|experienced')),
+)
+_PREFERENCE_PATTERNS = (
+    ('theory_heavy', re.compile('theory|concept|understanding')),
+    ('coding_heavy', re.compile('coding|practice|hands-on')),
+    ('balanced', re.compile('balanced|mix|both')),
+    ('project_based', re.compile('project|build|real')),
+)
+
+# Intent keywords for the phase handlers, matched case-insensitively anywhere
+# in the raw query, like the substring checks they replace
+_INTENT_RE = re.compile('interview|prepare|job|coding', re.IGNORECASE)
+CONFIRM_KEYWORDS_RE = re.compile('yes|start|create|begin|proceed', re.IGNORECASE)
+_SATISFIED_RE = re.compile('satisfied|good|perfect|thanks|done|complete', re.IGNORECASE)
+_REFINE_RE = re.compile('adjust|change|modify|refine|update|improve', re.IGNORECASE)
+
+
+def is_confirmation(query: str) -> bool:
+    """Whether the query confirms that the preparation plan should be created."""
+    return CONFIRM_KEYWORDS_RE.search(query) is not None
+
+
+def _last_user_line_lower(query: str) -> str:
+    """Lower-cased last non-empty line of the query, without splitting the whole text."""
+    text = query.rstrip()
+    return text[text.rfind('\n') + 1:].strip().lower()
+
+
+# Static phase responses, built once at import
+_INTERVIEW_WELCOME = """Great! I'm here to help you prepare for interviews. Let me gather some information to create a personalized preparation plan.
+
+First, which interview domains would you like to focus on? You can choose multiple:
+
+- **Algorithms** - Data structures, algorithms, coding problems
+- **System Design** - Scalable system architecture, distributed systems
+- **Databases** - SQL, NoSQL, database design
+- **Machine Learning** - ML algorithms, data science concepts
+- **Behavioral** - Soft skills, situational questions
+- **Frontend** - JavaScript, React, UI/UX
+- **Backend** - APIs, microservices, server architecture
+
+Please tell me which domains interest you, or type "all" if you want comprehensive preparation."""
+
+_INITIAL_GREETING = """Hello! I'm your Interview Preparation Coach. I help professionals prepare for technical interviews with personalized study plans and resources.
+
+I can help you with:
+- Algorithm and coding interview prep
+- System design interview guidance
+- Domain-specific preparation (ML, databases, etc.)
+- Company-specific interview insights
+- Personalized study schedules
+
+Would you like to start preparing for interviews? Just say "I want to prepare for interviews" or tell me about your specific goals!"""
+
+_DOMAIN_HELP = """I didn't quite catch which domains you'd like to focus on. Please choose from:
+
+- **Algorithms** (or "algo")
+- **System Design** (or "systems")
+- **Databases** (or "db")
+- **Machine Learning** (or "ml")
+- **Behavioral**
+- **Frontend**
+- **Backend**
+
+You can say something like "I want to focus on algorithms and system design" or just "algorithms, databases"."""
+
+_LEVEL_HELP = """Please let me know your skill level:
+
+- **Beginner** - New to these topics
+- **Intermediate** - Some experience
+- **Advanced** - Experienced professional
 
+Just say "beginner", "intermediate", or "advanced"."""
 
-class InterviewPrepState(TypedDict):
-    """State schema for the interview prep agent."""
-    messages: Annotated[list, add_messages]
-    conversation_state: Dict[str, Any]
-    structured_response: InterviewPrepResponseFormat
+_PREF_HELP = """Please choose your learning preference:
+
+- **Theory-Heavy** - Focus on concepts and understanding
+- **Coding-Heavy** - Emphasis on practice and coding
+- **Balanced** - Mix of theory and practice
+- **Project-Based** - Learn through building projects
+
+Just say something like "I prefer coding-heavy" or "balanced approach"."""
+
+_READY_CONFIRM_RETRY = 'Please confirm if you want me to create your preparation plan by saying **"Yes, create my plan"**.'
+
+_PLAN_COMPLETE = """Excellent! Your interview preparation plan is complete.
+
+**Next Steps:**
+1. Save your preparation plan for reference
+2. Start with Week 1 activities
+3. Track your progress regularly
+4. Come back anytime for plan updates
+
+Good luck with your interview preparation!"""
+
+_REFINEMENT_PROMPT = """I'd be happy to refine your preparation plan!
+
+What would you like me to adjust? For example:
+- Add more focus on specific domains
+- Change the timeline or intensity
+- Include specific companies or roles
+- Modify learning resources or style
+- Any other specific requirements
+
+Please describe what you'd like me to change."""
+
+_PLAN_DELIVERED_RETRY = """Are you satisfied with your preparation plan, or would you like me to make any adjustments?
+
+You can say:
+- **"I'm satisfied"** or **"This looks good"** to complete
+- **"I want to adjust..."** to request changes"""
+
+_COMPLETED_FOLLOWUP = "Your preparation plan has been completed! Is there anything specific you'd like me to adjust or explain further?"
+
+# Static tails of the interpolating prompts
+_LEVEL_QUESTION = """
+
+Now, what's your current skill level in these areas?
+
+- **Beginner** - New to the field, learning fundamentals
+- **Intermediate** - Some experience, comfortable with basics
+- **Advanced** - Experienced, looking to master complex topics
+
+Please tell me your skill level."""
+
+_PREFERENCE_QUESTION = """
+
+Now, what's your learning preference?
+
+- **Theory-Heavy** - Focus on concepts, principles, and understanding
+- **Coding-Heavy** - Emphasis on practice problems and hands-on coding
+- **Balanced** - Mix of theory and practical exercises
+- **Project-Based** - Learn through building real projects
+
+What approach works best for you?"""
+
+_PLAN_CONFIRM_PROMPT = """
+
+I'm ready to create your personalized interview preparation plan. This will involve:
+- Researching latest interview trends and resources
+- Creating a customized study schedule
+- Finding domain-specific practice materials
+- Generating a comprehensive roadmap
+
+**This process takes 2-3 minutes. Would you like me to start creating your plan?**
+
+Reply with **"Yes, create my plan"** to begin processing."""
+
+# Static sections of the preparation plan
+_PRACTICE_PLATFORMS = """**Popular Practice Platforms:**
+- LeetCode - Algorithm practice
+- System Design Primer - Architecture concepts
+- Pramp - Mock interviews
+- InterviewBit - Comprehensive prep
+
+"""
+
+_SCHEDULE_BY_PREFERENCE = {
+    'coding_heavy': """💡 **Daily Schedule Recommendation**
+- 1.5 hours: Coding practice
+- 30 minutes: System design study
+- 30 minutes: Domain-specific learning
+""",
+    'theory_heavy': """💡 **Daily Schedule Recommendation**
+- 1 hour: Theory and concept study
+- 45 minutes: System design reading
+- 45 minutes: Coding practice
+""",
+    'project_based': """💡 **Daily Schedule Recommendation**
+- 1 hour: Project development
+- 30 minutes: Code review and optimization
+- 1 hour: Related theory study
+""",
+    'balanced': """💡 **Daily Schedule Recommendation**
+- 1 hour: Coding practice
+- 30 minutes: System design study
+- 30 minutes: Domain-specific learning
+""",
+}
+
+_BASIC_PLAN_NOTE = "\n**Note:** This is a basic plan. For a more detailed, research-backed plan, please ensure web search is enabled.\n"
+
+_PLAN_FEEDBACK_PROMPT = """
+**Are you satisfied with this preparation plan, or would you like me to make any adjustments?**
+
+You can say:
+- **"I'm satisfied"** or **"This looks perfect!"** to complete
+- **"I want to adjust..."** to request specific changes
+
+What would you like to do next?"""
+
+
+
+# Research result sections listed under each domain: (key, icon, max results shown)
+_DOMAIN_RESOURCE_SECTIONS = (
+    ('current_guides', '📖', 2),
+    ('interview_info', '📚', 2),
+    ('youtube_resources', '🎥', 2),
+    ('leetcode_problems', '💻', 3),
+)
+
+
+def _valid_links(results: Iterable[Dict[str, Any]]) -> Iterator[tuple[str, str]]:
+    """Yield (url, title) for the results that have both."""
+    return ((r['url'], r['title']) for r in results if r.get('url') and r.get('title'))
+
+
+@lru_cache(maxsize=32)
+def _plan_skeleton(skill_level: Optional[str], preference: Optional[str]) -> tuple[str, str]:
+    """
+    Render the parts of a plan that depend only on skill level and preference.
+
+    Returns the week-by-week schedule that follows the overview and the
+    platforms/daily-schedule block that follows the domain resources.
+    """
+    # Determine preparation timeline based on skill level
+    timeline_weeks = 8 if skill_level == 'advanced' else 12 if skill_level == 'intermediate' else 16
+
+    # Timeline breakdown
+    foundation_weeks = timeline_weeks // 4
+    skill_weeks = timeline_weeks // 4
+    advanced_weeks = timeline_weeks // 4
+
+    schedule = f"""📅 **{timeline_weeks}-Week Preparation Schedule**
+
+**Weeks 1-{foundation_weeks}: Foundation Building**
+- Review fundamental concepts
+- Set up practice environment
+- Begin daily coding practice
+
+**Weeks {foundation_weeks+1}-{foundation_weeks+skill_weeks}: Core Skills Development**
+- Focus on key algorithms and data structures
+- Practice system design basics
+- Mock interview sessions
+
+**Weeks {foundation_weeks+skill_weeks+1}-{foundation_weeks+skill_weeks+advanced_weeks}: Advanced Topics**
+- Complex problem solving
+- In-depth system design
+- Domain-specific deep dives
+
+**Weeks {foundation_weeks+skill_weeks+advanced_weeks+1}-{timeline_weeks}: Final Preparation**
+- Company research and preparation
+- Final mock interviews
+- Review and polish
+
+🔗 **Essential Resources**
+
+"""
+    closing = _PRACTICE_PLATFORMS + _SCHEDULE_BY_PREFERENCE.get(preference, _SCHEDULE_BY_PREFERENCE['balanced'])
+    return schedule, closing
+
+@dataclass(slots=True)
+class AgentYield:
+    """One streamed agent response, read by the executor."""
+    is_task_complete: bool
+    require_user_input: bool
+    content: str
+    phase: str
+    trigger_async_processing: bool = False      # Executor starts async plan generation
+    trigger_refinement_processing: bool = False  # Executor generates the refined plan
+
+
+class InterviewPrepResponseFormat(TypedDict):
+    """Response format for the interview prep agent.
+
+    Missing keys take their defaults: status 'input_required', phase
+    'initial', no collected inputs and no push notification trigger.
+    """
+    status: NotRequired[Literal['input_required', 'processing', 'completed', 'error']]
+    message: str
+    phase: NotRequired[str]
+    collected_inputs: NotRequired[Optional[Dict[str, Any]]]
+    trigger_push_notification: NotRequired[bool]
 
 
 class InterviewPrepAgent:
@@ -90,11 +370,17 @@ Include the current conversation phase and any collected inputs.
 For processing status, indicate if web search is required and provide search queries.
 """
 
+    # Static prompt prefix, built once; keeping it byte-identical across turns
+    # lets Gemini's implicit prefix caching apply to it
+    PROMPT = f"{SYSTEM_INSTRUCTION}\n\n{FORMAT_INSTRUCTION}"
+
     def __init__(self):
         """Initialize the Interview Preparation Agent."""
         # Initialize Google Gemini model
         model_source = os.getenv('MODEL_SOURCE', 'google')
         if model_source == 'google':
+            from langchain_google_genai import ChatGoogleGenerativeAI
+
             self.model = ChatGoogleGenerativeAI(
                 model='gemini-2.0-flash',
                 temperature=0.3
@@ -102,9 +388,6 @@ For processing status, indicate if web search is required and provide search que
         else:
             raise ValueError("Only Google Gemini is supported in this implementation")
 
-        # Initialize web search manager
-        self.search_manager = WebSearchManager()
-
         # Setup tools
         self.tools = [
             search_interview_resources,
@@ -115,23 +398,66 @@ For processing status, indicate if web search is required and provide search que
             search_current_interview_guides
         ]
 
-        # Initialize memory for conversation persistence
-        self.memory = MemorySaver()
+        # In-memory state store bounded by size and idle time, holding msgpack
+        # snapshots rather than live models. Lookups and inserts never await,
+        # so no lock is needed on the event loop.
+        self.conversation_states: TTLCache[str, bytes] = TTLCache(
+            maxsize=int(os.getenv('CONVERSATION_CACHE_MAX', '10000')),
+            ttl=int(os.getenv('CONVERSATION_TTL_SECONDS', '3600')),
+        )
+        # Recently used states stay live, so every lookup during a request (and
+        # consecutive turns of one conversation) skips decoding the snapshot
+        self._live_states: LRUCache[str, ConversationState] = LRUCache(
+            maxsize=int(os.getenv('LIVE_STATE_CACHE_MAX', '64'))
+        )
+        # Plans covering at least this many domains are rendered in a worker thread
+        self.thread_render_min_domains = int(os.getenv('PLAN_THREAD_RENDER_MIN_DOMAINS', '4'))
+
+        # Phase dispatch table used by stream()
+        self._phase_handlers = {
+            PHASE.INITIAL: self._handle_initial_phase,
+            PHASE.DOMAIN_SELECTION: self._handle_domain_selection,
+            PHASE.LEVEL_ASSESSMENT: self._handle_level_assessment,
+            PHASE.PREFERENCE_GATHERING: self._handle_preference_gathering,
+            PHASE.READY_TO_PROCESS: self._handle_ready_to_process,
+            PHASE.ASYNC_PROCESSING: self._handle_async_processing,
+            PHASE.PLAN_DELIVERED: self._handle_plan_delivered,
+            PHASE.REFINEMENT_INPUT: self._handle_refinement_input,
+            PHASE.REFINEMENT_PROCESSING: self._handle_refinement_processing,
+            PHASE.COMPLETED: self._handle_completed_phase,
+        }
+
+        logger.info("InterviewPrepAgent initialized with Google Gemini and web search tools")
+
+    # The phase handlers never call the LLM, so the search manager, the
+    # checkpointer and the LangGraph agent (and the LangGraph imports) are
+    # only loaded on first use
+
+    @cached_property
+    def search_manager(self) -> WebSearchManager:
+        """Web search manager."""
+        return WebSearchManager()
+
+    @cached_property
+    def memory(self) -> 'MemorySaver':
+        """Checkpointer for conversation persistence in the LangGraph agent."""
+        from langgraph.checkpoint.memory import MemorySaver
 
-        # Simple in-memory state store (for demo purposes)
-        self.conversation_states: Dict[str, ConversationState] = {}
+        return MemorySaver()
 
-        # Create the LangGraph agent
-        self.graph = create_react_agent(
+    @cached_property
+    def graph(self):
+        """LangGraph ReAct agent over the model and web search tools."""
+        from langgraph.prebuilt import create_react_agent
+
+        return create_react_agent(
             self.model,
             tools=self.tools,
             checkpointer=self.memory,
-            prompt=f"{self.SYSTEM_INSTRUCTION}\n\n{self.FORMAT_INSTRUCTION}"
+            prompt=self.PROMPT
         )
 
-        logger.info("InterviewPrepAgent initialized with Google Gemini and web search tools")
-
-    async def stream(self, query: str, context_id: str) -> AsyncIterableType[Dict[str, Any]]:
+    async def stream(self, query: str, context_id: str) -> AsyncIterableType[AgentYield]:
         """
         Process user input and stream responses.
 
@@ -140,7 +466,7 @@ For processing status, indicate if web search is required and provide search que
             context_id: Conversation context identifier
 
         Yields:
-            Dictionary with response information for A2A protocol
+            AgentYield with response information for A2A protocol
         """
         try:
             # Get current conversation state
@@ -150,218 +476,130 @@ For processing status, indicate if web search is required and provide search que
             conversation_state.add_message("user", query)
 
             # Process based on current phase
-            if conversation_state.phase == ConversationPhase.INITIAL:
-                async for item in self._handle_initial_phase(query, conversation_state, context_id):
-                    yield item
-
-            elif conversation_state.phase == ConversationPhase.DOMAIN_SELECTION:
-                async for item in self._handle_domain_selection(query, conversation_state, context_id):
-                    yield item
-
-            elif conversation_state.phase == ConversationPhase.LEVEL_ASSESSMENT:
-                async for item in self._handle_level_assessment(query, conversation_state, context_id):
-                    yield item
-
-            elif conversation_state.phase == ConversationPhase.PREFERENCE_GATHERING:
-                async for item in self._handle_preference_gathering(query, conversation_state, context_id):
-                    yield item
-
-            elif conversation_state.phase == ConversationPhase.READY_TO_PROCESS:
-                async for item in self._handle_ready_to_process(query, conversation_state, context_id):
-                    yield item
-
-            elif conversation_state.phase == ConversationPhase.ASYNC_PROCESSING:
-                async for item in self._handle_async_processing(query, conversation_state, context_id):
-                    yield item
-
-            elif conversation_state.phase == ConversationPhase.PLAN_DELIVERED:
-                async for item in self._handle_plan_delivered(query, conversation_state, context_id):
-                    yield item
-
-            elif conversation_state.phase == ConversationPhase.REFINEMENT_INPUT:
-                async for item in self._handle_refinement_input(query, conversation_state, context_id):
-                    yield item
-
-            elif conversation_state.phase == ConversationPhase.REFINEMENT_PROCESSING:
-                async for item in self._handle_refinement_processing(query, conversation_state, context_id):
-                    yield item
-
-            elif conversation_state.phase == ConversationPhase.COMPLETED:
-                async for item in self._handle_completed_phase(query, conversation_state, context_id):
+            handler = self._phase_handlers.get(conversation_state.phase)
+            if handler is None:
+                await self._save_conversation_state(context_id, conversation_state)
+            else:
+                async for item in handler(query, conversation_state, context_id):
+                    # Save updated state before handing the item on; the executor
+                    # stops iterating at trigger items, so a save after the loop
+                    # would not run for those turns
+                    await self._save_conversation_state(context_id, conversation_state)
                     yield item
 
-            # Save updated state
-            await self._save_conversation_state(context_id, conversation_state)
-
         except Exception as e:
-            logger.error(f"Error in stream method: {e}")
-            yield {
-                'is_task_complete': False,
-                'require_user_input': True,
-                'content': f"I encountered an error: {str(e)}. Please try again or rephrase your request.",
-                'phase': 'error'
-            }
+            logger.error("Error in stream method: %s", e)
+            yield AgentYield(
+                is_task_complete=False,
+                require_user_input=True,
+                content=f"I encountered an error: {str(e)}. Please try again or rephrase your request.",
+                phase='error'
+            )
 
     async def _get_conversation_state(self, context_id: str) -> ConversationState:
         """Retrieve or create conversation state for the given context."""
-        if context_id in self.conversation_states:
-            existing_state = self.conversation_states[context_id]
-            logger.info(f"Retrieved existing state for {context_id}: phase={existing_state.phase}, domains={existing_state.user_inputs.domains}")
+        snapshot = self.conversation_states.get(context_id)
+        if snapshot is not None:
+            existing_state = self._live_states.get(context_id)
+            if existing_state is None:
+                existing_state = ConversationState.model_validate(unpackb(snapshot))
+                self._live_states[context_id] = existing_state
+            logger.debug("Retrieved existing state for %s: phase=%s, domains=%s", context_id, existing_state.phase, existing_state.user_inputs.domains)
             return existing_state
         else:
-            logger.info(f"Creating new state for {context_id}")
+            logger.info("Creating new state for %s", context_id)
             new_state = ConversationState()
-            self.conversation_states[context_id] = new_state
+            self.conversation_states[context_id] = packb(new_state)
+            self._live_states[context_id] = new_state
             return new_state
 
     async def _save_conversation_state(self, context_id: str, state: ConversationState) -> None:
         """Save conversation state."""
-        self.conversation_states[context_id] = state
-        logger.info(f"Saved state for {context_id}: phase={state.phase}")
+        self.conversation_states[context_id] = packb(state)
+        self._live_states[context_id] = state
+        logger.debug("Saved state for %s: phase=%s", context_id, state.phase)
 
     async def _handle_initial_phase(
         self,
         query: str,
         state: ConversationState,
         context_id: str
-    ) -> AsyncIterableType[Dict[str, Any]]:
+    ) -> AsyncIterableType[AgentYield]:
         """Handle the initial phase of conversation."""
         logger.info("Handling initial phase")
 
         # Check if user is asking for interview preparation
-        if any(keyword in query.lower() for keyword in ['interview', 'prepare', 'job', 'coding']):
-            state.advance_phase(ConversationPhase.DOMAIN_SELECTION)
+        if _INTENT_RE.search(query):
+            state.advance_phase(PHASE.DOMAIN_SELECTION)
             state.add_message("agent", "Great! I'll help you prepare for interviews.")
 
-            yield {
-                'is_task_complete': False,
-                'require_user_input': True,
-                'content': """Great! I'm here to help you prepare for interviews. Let me gather some information to create a personalized preparation plan.
-
-First, which interview domains would you like to focus on? You can choose multiple:
-
-- **Algorithms** - Data structures, algorithms, coding problems
-- **System Design** - Scalable system architecture, distributed systems
-- **Databases** - SQL, NoSQL, database design
-- **Machine Learning** - ML algorithms, data science concepts
-- **Behavioral** - Soft skills, situational questions
-- **Frontend** - JavaScript, React, UI/UX
-- **Backend** - APIs, microservices, server architecture
-
-Please tell me which domains interest you, or type "all" if you want comprehensive preparation.""",
-                'phase': ConversationPhase.DOMAIN_SELECTION
-            }
+            yield AgentYield(
+                is_task_complete=False,
+                require_user_input=True,
+                content=_INTERVIEW_WELCOME,
+                phase=PHASE.DOMAIN_SELECTION
+            )
         else:
-            yield {
-                'is_task_complete': False,
-                'require_user_input': True,
-                'content': """Hello! I'm your Interview Preparation Coach. I help professionals prepare for technical interviews with personalized study plans and resources.
-
-I can help you with:
-- Algorithm and coding interview prep
-- System design interview guidance
-- Domain-specific preparation (ML, databases, etc.)
-- Company-specific interview insights
-- Personalized study schedules
-
-Would you like to start preparing for interviews? Just say "I want to prepare for interviews" or tell me about your specific goals!""",
-                'phase': ConversationPhase.INITIAL
-            }
+            yield AgentYield(
+                is_task_complete=False,
+                require_user_input=True,
+                content=_INITIAL_GREETING,
+                phase=PHASE.INITIAL
+            )
 
     async def _handle_domain_selection(
         self,
         query: str,
         state: ConversationState,
         context_id: str
-    ) -> AsyncIterableType[Dict[str, Any]]:
+    ) -> AsyncIterableType[AgentYield]:
         """Handle domain selection phase."""
         logger.info("Handling domain selection phase")
-        logger.info(f"User query: {query}")
+        logger.debug("User query: %s", query)
 
         # Parse domains from user input
         domains = self._parse_domains(query)
-        logger.info(f"Parsed domains: {domains}")
+        logger.debug("Parsed domains: %s", domains)
 
         if domains:
             state.user_inputs.domains = domains
-            logger.info(f"Set state.user_inputs.domains to: {state.user_inputs.domains}")
-            state.advance_phase(ConversationPhase.LEVEL_ASSESSMENT)
+            logger.debug("Set state.user_inputs.domains to: %s", state.user_inputs.domains)
+            state.advance_phase(PHASE.LEVEL_ASSESSMENT)
             state.add_message("agent", f"Selected domains: {', '.join(domains)}")
 
-            domain_list = ", ".join([domain.replace('_', ' ').title() for domain in domains])
-
-            yield {
-                'is_task_complete': False,
-                'require_user_input': True,
-                'content': f"""Perfect! You've selected: **{domain_list}**
-
-Now, what's your current skill level in these areas?
-
-- **Beginner** - New to the field, learning fundamentals
-- **Intermediate** - Some experience, comfortable with basics
-- **Advanced** - Experienced, looking to master complex topics
+            domain_list = state.user_inputs.domains_display
 
-Please tell me your skill level.""",
-                'phase': ConversationPhase.LEVEL_ASSESSMENT
-            }
+            yield AgentYield(
+                is_task_complete=False,
+                require_user_input=True,
+                content=f"Perfect! You've selected: **{domain_list}**" + _LEVEL_QUESTION,
+                phase=PHASE.LEVEL_ASSESSMENT
+            )
         else:
-            yield {
-                'is_task_complete': False,
-                'require_user_input': True,
-                'content': """I didn't quite catch which domains you'd like to focus on. Please choose from:
-
-- **Algorithms** (or "algo")
-- **System Design** (or "systems")
-- **Databases** (or "db")
-- **Machine Learning** (or "ml")
-- **Behavioral**
-- **Frontend**
-- **Backend**
-
-You can say something like "I want to focus on algorithms and system design" or just "algorithms, databases".""",
-                'phase': ConversationPhase.DOMAIN_SELECTION
-            }
+            yield AgentYield(
+                is_task_complete=False,
+                require_user_input=True,
+                content=_DOMAIN_HELP,
+                phase=PHASE.DOMAIN_SELECTION
+            )
 
     def _parse_domains(self, query: str) -> List[str]:
         """Parse interview domains from user input."""
-        # Extract only the last user message (split by newlines and take the last non-empty line)
-        lines = [line.strip() for line in query.strip().split('\n') if line.strip()]
-        user_input = lines[-1] if lines else query
-
-        query_lower = user_input.lower()
-        domains = []
+        # Only the last non-empty line carries the user's latest message
+        query_lower = _last_user_line_lower(query)
 
-        logger.info(f"_parse_domains called with full query length: {len(query)} chars")
-        logger.info(f"Extracted user input: '{user_input}'")
-        logger.info(f"query_lower: '{query_lower}'")
+        logger.debug("_parse_domains called with full query length: %d chars", len(query))
+        logger.debug("Extracted user input: '%s'", query_lower)
 
         # Check for "all" as a standalone word (not part of other text)
-        import re
-        if re.search(r'\ball\b', query_lower) or 'everything' in query_lower:
-            logger.info("Matched 'all' condition, returning all domains")
-            return ['algorithms', 'system_design', 'databases', 'machine_learning', 'behavioral', 'frontend', 'backend']
-
-        # Domain keywords with priorities (check longer/more specific phrases first)
-        domain_keywords = {
-            'algorithms': ['algorithm', 'algo', 'dsa', 'leetcode'],
-            'system_design': ['system design', 'systems design', 'system architecture', 'distributed system'],
-            'databases': ['database', 'db', 'sql'],
-            'machine_learning': ['machine learning', 'ml', 'data science'],
-            'behavioral': ['behavioral', 'behavior', 'soft skill'],
-            'frontend': ['frontend', 'front-end', 'react', 'javascript', 'ui/ux'],
-            'backend': ['backend', 'back-end', 'server', 'microservice']
-        }
+        if _ALL_RE.search(query_lower):
+            logger.debug("Matched 'all' condition, returning all domains")
+            return list(_ALL_DOMAINS)
 
-        # Check each domain
-        for domain, keywords in domain_keywords.items():
-            for keyword in keywords:
-                if keyword in query_lower:
-                    logger.info(f"Matched domain '{domain}' with keyword '{keyword}'")
-                    if domain not in domains:
-                        domains.append(domain)
-                    break  # Found a match, move to next domain
+        matched = {_KEYWORD_DOMAIN[m.group(1)] for m in _DOMAIN_RE.finditer(query_lower)}
+        domains = [domain for domain in _DOMAIN_KEYWORDS if domain in matched]
 
-        logger.info(f"Returning domains: {domains}")
+        logger.debug("Returning domains: %s", domains)
         return domains
 
     async def _handle_level_assessment(
@@ -369,7 +607,7 @@ You can say something like "I want to focus on algorithms and system design" or
         query: str,
         state: ConversationState,
         context_id: str
-    ) -> AsyncIterableType[Dict[str, Any]]:
+    ) -> AsyncIterableType[AgentYield]:
         """Handle skill level assessment phase."""
         logger.info("Handling level assessment phase")
 
@@ -377,51 +615,31 @@ You can say something like "I want to focus on algorithms and system design" or
 
         if level:
             state.user_inputs.skill_level = level
-            state.advance_phase(ConversationPhase.PREFERENCE_GATHERING)
+            state.advance_phase(PHASE.PREFERENCE_GATHERING)
             state.add_message("agent", f"Skill level: {level}")
 
-            yield {
-                'is_task_complete': False,
-                'require_user_input': True,
-                'content': f"""Great! I've noted your skill level as **{level.replace('_', ' ').title()}**.
-
-Now, what's your learning preference?
-
-- **Theory-Heavy** - Focus on concepts, principles, and understanding
-- **Coding-Heavy** - Emphasis on practice problems and hands-on coding
-- **Balanced** - Mix of theory and practical exercises
-- **Project-Based** - Learn through building real projects
-
-What approach works best for you?""",
-                'phase': ConversationPhase.PREFERENCE_GATHERING
-            }
+            yield AgentYield(
+                is_task_complete=False,
+                require_user_input=True,
+                content=f"Great! I've noted your skill level as **{display_name(level)}**." + _PREFERENCE_QUESTION,
+                phase=PHASE.PREFERENCE_GATHERING
+            )
         else:
-            yield {
-                'is_task_complete': False,
-                'require_user_input': True,
-                'content': """Please let me know your skill level:
-
-- **Beginner** - New to these topics
-- **Intermediate** - Some experience
-- **Advanced** - Experienced professional
-
-Just say "beginner", "intermediate", or "advanced".""",
-                'phase': ConversationPhase.LEVEL_ASSESSMENT
-            }
+            yield AgentYield(
+                is_task_complete=False,
+                require_user_input=True,
+                content=_LEVEL_HELP,
+                phase=PHASE.LEVEL_ASSESSMENT
+            )
 
     def _parse_skill_level(self, query: str) -> Optional[str]:
         """Parse skill level from user input."""
         # Extract only the last user message
-        lines = [line.strip() for line in query.strip().split('\n') if line.strip()]
-        user_input = lines[-1] if lines else query
-        query_lower = user_input.lower()
+        query_lower = _last_user_line_lower(query)
 
-        if any(word in query_lower for word in ['beginner', 'new', 'start']):
-            return 'beginner'
-        elif any(word in query_lower for word in ['intermediate', 'some experience', 'mid']):
-            return 'intermediate'
-        elif any(word in query_lower for word in ['advanced', 'expert', 'experienced']):
-            return 'advanced'
+        for level, pattern in _SKILL_LEVEL_PATTERNS:
+            if pattern.search(query_lower):
+                return level
 
         return None
 
@@ -430,7 +648,7 @@ Just say "beginner", "intermediate", or "advanced".""",
         query: str,
         state: ConversationState,
         context_id: str
-    ) -> AsyncIterableType[Dict[str, Any]]:
+    ) -> AsyncIterableType[AgentYield]:
         """Handle learning preference gathering phase."""
         logger.info("Handling preference gathering phase")
 
@@ -442,70 +660,46 @@ Just say "beginner", "intermediate", or "advanced".""",
 
             # Check if we have all required inputs
             if state.is_input_complete():
-                state.advance_phase(ConversationPhase.READY_TO_PROCESS)
+                state.advance_phase(PHASE.READY_TO_PROCESS)
                 state.awaiting_processing_confirmation = True
 
                 # Show summary and ask for confirmation
-                domains_str = ", ".join([d.replace('_', ' ').title() for d in state.user_inputs.domains])
+                domains_str = state.user_inputs.domains_display
 
-                yield {
-                    'is_task_complete': False,
-                    'require_user_input': True,
-                    'content': f"""Perfect! Here's what I've gathered:
+                yield AgentYield(
+                    is_task_complete=False,
+                    require_user_input=True,
+                    content=f"""Perfect! Here's what I've gathered:
 
 **Domains:** {domains_str}
-**Skill Level:** {state.user_inputs.skill_level.replace('_', ' ').title()}
-**Learning Style:** {preference.replace('_', ' ').title()}
-
-I'm ready to create your personalized interview preparation plan. This will involve:
-- Researching latest interview trends and resources
-- Creating a customized study schedule
-- Finding domain-specific practice materials
-- Generating a comprehensive roadmap
-
-**This process takes 2-3 minutes. Would you like me to start creating your plan?**
-
-Reply with **"Yes, create my plan"** to begin processing.""",
-                    'phase': ConversationPhase.READY_TO_PROCESS
-                }
+**Skill Level:** {display_name(state.user_inputs.skill_level)}
+**Learning Style:** {display_name(preference)}""" + _PLAN_CONFIRM_PROMPT,
+                    phase=PHASE.READY_TO_PROCESS
+                )
             else:
                 # Ask for any missing information
-                yield {
-                    'is_task_complete': False,
-                    'require_user_input': True,
-                    'content': "I still need some more information. Could you please provide your learning preference?",
-                    'phase': ConversationPhase.PREFERENCE_GATHERING
-                }
+                yield AgentYield(
+                    is_task_complete=False,
+                    require_user_input=True,
+                    content="I still need some more information. Could you please provide your learning preference?",
+                    phase=PHASE.PREFERENCE_GATHERING
+                )
         else:
-            yield {
-                'is_task_complete': False,
-                'require_user_input': True,
-                'content': """Please choose your learning preference:
-
-- **Theory-Heavy** - Focus on concepts and understanding
-- **Coding-Heavy** - Emphasis on practice and coding
-- **Balanced** - Mix of theory and practice
-- **Project-Based** - Learn through building projects
-
-Just say something like "I prefer coding-heavy" or "balanced approach".""",
-                'phase': ConversationPhase.PREFERENCE_GATHERING
-            }
+            yield AgentYield(
+                is_task_complete=False,
+                require_user_input=True,
+                content=_PREF_HELP,
+                phase=PHASE.PREFERENCE_GATHERING
+            )
 
     def _parse_preference(self, query: str) -> Optional[str]:
         """Parse learning preference from user input."""
         # Extract only the last user message
-        lines = [line.strip() for line in query.strip().split('\n') if line.strip()]
-        user_input = lines[-1] if lines else query
-        query_lower = user_input.lower()
-
-        if any(word in query_lower for word in ['theory', 'concept', 'understanding']):
-            return 'theory_heavy'
-        elif any(word in query_lower for word in ['coding', 'practice', 'hands-on']):
-            return 'coding_heavy'
-        elif any(word in query_lower for word in ['balanced', 'mix', 'both']):
-            return 'balanced'
-        elif any(word in query_lower for word in ['project', 'build', 'real']):
-            return 'project_based'
+        query_lower = _last_user_line_lower(query)
+
+        for preference, pattern in _PREFERENCE_PATTERNS:
+            if pattern.search(query_lower):
+                return preference
 
         return None
 
@@ -514,139 +708,118 @@ Just say something like "I prefer coding-heavy" or "balanced approach".""",
         query: str,
         state: ConversationState,
         context_id: str
-    ) -> AsyncIterableType[Dict[str, Any]]:
+    ) -> AsyncIterableType[AgentYield]:
         """Handle processing confirmation and trigger push notifications."""
         logger.info("Handling ready to process phase")
 
-        if any(word in query.lower() for word in ['yes', 'start', 'create', 'begin', 'proceed']):
+        if is_confirmation(query):
             # Don't advance phase here - let the executor handle async processing
             state.awaiting_processing_confirmation = False
 
-            yield {
-                'is_task_complete': False,
-                'require_user_input': False,
-                'content': 'Processing your interview preparation request...',
-                'phase': ConversationPhase.READY_TO_PROCESS,
-                'trigger_async_processing': True  # Signal for executor to start async processing
-            }
+            yield AgentYield(
+                is_task_complete=False,
+                require_user_input=False,
+                content='Processing your interview preparation request...',
+                phase=PHASE.READY_TO_PROCESS,
+                trigger_async_processing=True  # Signal for executor to start async processing
+            )
         else:
-            yield {
-                'is_task_complete': False,
-                'require_user_input': True,
-                'content': 'Please confirm if you want me to create your preparation plan by saying **"Yes, create my plan"**.',
-                'phase': ConversationPhase.READY_TO_PROCESS
-            }
+            yield AgentYield(
+                is_task_complete=False,
+                require_user_input=True,
+                content=_READY_CONFIRM_RETRY,
+                phase=PHASE.READY_TO_PROCESS
+            )
 
     async def _handle_async_processing(
         self,
         query: str,
         state: ConversationState,
         context_id: str
-    ) -> AsyncIterableType[Dict[str, Any]]:
+    ) -> AsyncIterableType[AgentYield]:
         """Handle the async processing phase - should not be called directly."""
         logger.info("Handling async processing phase")
 
-        yield {
-            'is_task_complete': False,
-            'require_user_input': False,
-            'content': "I'm currently processing your request. Please wait for the results via push notification.",
-            'phase': ConversationPhase.ASYNC_PROCESSING
-        }
+        yield AgentYield(
+            is_task_complete=False,
+            require_user_input=False,
+            content="I'm currently processing your request. Please wait for the results via push notification.",
+            phase=PHASE.ASYNC_PROCESSING
+        )
 
     async def _handle_plan_delivered(
         self,
         query: str,
         state: ConversationState,
         context_id: str
-    ) -> AsyncIterableType[Dict[str, Any]]:
+    ) -> AsyncIterableType[AgentYield]:
         """Handle satisfaction check after plan delivery."""
         logger.info("Handling plan delivered phase")
 
-        if any(word in query.lower() for word in ['satisfied', 'good', 'perfect', 'thanks', 'done', 'complete']):
-            state.advance_phase(ConversationPhase.COMPLETED)
+        if _SATISFIED_RE.search(query):
+            state.advance_phase(PHASE.COMPLETED)
             state.satisfaction_confirmed = True
 
-            yield {
-                'is_task_complete': True,
-                'require_user_input': False,
-                'content': """Excellent! Your interview preparation plan is complete.
-
-**Next Steps:**
-1. Save your preparation plan for reference
-2. Start with Week 1 activities
-3. Track your progress regularly
-4. Come back anytime for plan updates
-
-Good luck with your interview preparation!""",
-                'phase': ConversationPhase.COMPLETED
-            }
-
-        elif any(word in query.lower() for word in ['adjust', 'change', 'modify', 'refine', 'update', 'improve']):
-            state.advance_phase(ConversationPhase.REFINEMENT_INPUT)
+            yield AgentYield(
+                is_task_complete=True,
+                require_user_input=False,
+                content=_PLAN_COMPLETE,
+                phase=PHASE.COMPLETED
+            )
 
-            yield {
-                'is_task_complete': False,
-                'require_user_input': True,
-                'content': """I'd be happy to refine your preparation plan!
+        elif _REFINE_RE.search(query):
+            state.advance_phase(PHASE.REFINEMENT_INPUT)
 
-What would you like me to adjust? For example:
-- Add more focus on specific domains
-- Change the timeline or intensity
-- Include specific companies or roles
-- Modify learning resources or style
-- Any other specific requirements
-
-Please describe what you'd like me to change.""",
-                'phase': ConversationPhase.REFINEMENT_INPUT
-            }
+            yield AgentYield(
+                is_task_complete=False,
+                require_user_input=True,
+                content=_REFINEMENT_PROMPT,
+                phase=PHASE.REFINEMENT_INPUT
+            )
         else:
-            yield {
-                'is_task_complete': False,
-                'require_user_input': True,
-                'content': """Are you satisfied with your preparation plan, or would you like me to make any adjustments?
-
-You can say:
-- **"I'm satisfied"** or **"This looks good"** to complete
-- **"I want to adjust..."** to request changes""",
-                'phase': ConversationPhase.PLAN_DELIVERED
-            }
+            yield AgentYield(
+                is_task_complete=False,
+                require_user_input=True,
+                content=_PLAN_DELIVERED_RETRY,
+                phase=PHASE.PLAN_DELIVERED
+            )
 
     async def _handle_refinement_input(
         self,
         query: str,
         state: ConversationState,
         context_id: str
-    ) -> AsyncIterableType[Dict[str, Any]]:
+    ) -> AsyncIterableType[AgentYield]:
         """Handle refinement input gathering."""
         logger.info("Handling refinement input phase")
 
         # Store the refinement request
         state.refinement_requests.append(query)
-        state.advance_phase(ConversationPhase.REFINEMENT_PROCESSING)
-
-        yield {
-            'is_task_complete': False,
-            'require_user_input': False,
-            'content': 'I understand your refinement request. Processing your adjustments...',
-            'phase': ConversationPhase.REFINEMENT_PROCESSING,
-            'trigger_refinement_processing': True  # Signal for refinement processing
-        }
+        state.advance_phase(PHASE.REFINEMENT_PROCESSING)
+
+        yield AgentYield(
+            is_task_complete=False,
+            require_user_input=False,
+            content='I understand your refinement request. Processing your adjustments...',
+            phase=PHASE.REFINEMENT_PROCESSING,
+            trigger_refinement_processing=True  # Signal for refinement processing
+        )
 
     async def _handle_refinement_processing(
         self,
         query: str,
         state: ConversationState,
         context_id: str
-    ) -> AsyncIterableType[Dict[str, Any]]:
+    ) -> AsyncIterableType[AgentYield]:
         """Handle refinement processing phase."""
         logger.info("Handling refinement processing phase")
 
-        yield {
-            'is_task_complete': False,
-            'require_user_input': False,
-            'content': "I'm processing your refinement request. Please wait for the updated plan.",
-            'phase': ConversationPhase.REFINEMENT_PROCESSING
-        }
+        yield AgentYield(
+            is_task_complete=False,
+            require_user_input=False,
+            content="I'm processing your refinement request. Please wait for the updated plan.",
+            phase=PHASE.REFINEMENT_PROCESSING
+        )
 
 
     async def _handle_completed_phase(
@@ -654,170 +827,91 @@ You can say:
         query: str,
         state: ConversationState,
         context_id: str
-    ) -> AsyncIterableType[Dict[str, Any]]:
+    ) -> AsyncIterableType[AgentYield]:
         """Handle completed phase."""
         logger.info("Handling completed phase")
 
-        yield {
-            'is_task_complete': True,
-            'require_user_input': False,
-            'content': "Your preparation plan has been completed! Is there anything specific you'd like me to adjust or explain further?",
-            'phase': ConversationPhase.COMPLETED
-        }
+        yield AgentYield(
+            is_task_complete=True,
+            require_user_input=False,
+            content=_COMPLETED_FOLLOWUP,
+            phase=PHASE.COMPLETED
+        )
 
-    async def create_preparation_plan(
-        self,
-        user_inputs: UserInputs,
-        research_data: Dict[str, Any]
-    ) -> str:
-        """Create a comprehensive preparation plan based on user inputs and research."""
-        try:
-            domains_str = ", ".join([d.replace('_', ' ').title() for d in user_inputs.domains])
+    def render_preparation_plan(self, user_inputs: UserInputs, research_data: Dict[str, Any]) -> str:
+        """Render the whole preparation plan synchronously."""
+        return "".join(self._iter_plan_sections(user_inputs, research_data))
 
-            # Determine preparation timeline based on skill level
-            timeline_weeks = 8 if user_inputs.skill_level == 'advanced' else 12 if user_inputs.skill_level == 'intermediate' else 16
+    def _iter_plan_sections(self, user_inputs: UserInputs, research_data: Dict[str, Any]) -> Iterator[str]:
+        """Yield the plan sections in order; pure string work with no I/O."""
+        schedule, closing = _plan_skeleton(user_inputs.skill_level, user_inputs.preference)
 
-            plan = f"""🎉 **Your Interview Preparation Plan is Ready!**
+        yield f"""🎉 **Your Interview Preparation Plan is Ready!**
 
 🎯 **Your Interview Preparation Plan**
 📋 **Overview**
-- **Domains:** {domains_str}
-- **Skill Level:** {user_inputs.skill_level.replace('_', ' ').title()}
-- **Learning Style:** {user_inputs.preference.replace('_', ' ').title()}
-
-📅 **{timeline_weeks}-Week Preparation Schedule**
-
-"""
-
-            # Timeline breakdown
-            foundation_weeks = timeline_weeks // 4
-            skill_weeks = timeline_weeks // 4
-            advanced_weeks = timeline_weeks // 4
-            final_weeks = timeline_weeks - (foundation_weeks + skill_weeks + advanced_weeks)
+- **Domains:** {user_inputs.domains_display}
+- **Skill Level:** {display_name(user_inputs.skill_level)}
+- **Learning Style:** {display_name(user_inputs.preference)}
 
-            plan += f"""**Weeks 1-{foundation_weeks}: Foundation Building**
-- Review fundamental concepts
-- Set up practice environment
-- Begin daily coding practice
+{schedule}"""
 
-**Weeks {foundation_weeks+1}-{foundation_weeks+skill_weeks}: Core Skills Development**
-- Focus on key algorithms and data structures
-- Practice system design basics
-- Mock interview sessions
+        # Add domain-specific resources from research, one section per domain
+        resource_count = 0
+        researched_domains = research_data.get('domains', {})
+        for domain in user_inputs.domains:
+            section, count = self._render_domain_section(domain, researched_domains.get(domain))
+            resource_count += count
+            yield section
 
-**Weeks {foundation_weeks+skill_weeks+1}-{foundation_weeks+skill_weeks+advanced_weeks}: Advanced Topics**
-- Complex problem solving
-- In-depth system design
-- Domain-specific deep dives
+        parts: List[str] = [closing]
 
-**Weeks {foundation_weeks+skill_weeks+advanced_weeks+1}-{timeline_weeks}: Final Preparation**
-- Company research and preparation
-- Final mock interviews
-- Review and polish
-
-🔗 **Essential Resources**
-
-"""
-
-            # Add researched resources from web search
-            resource_count = 0
-
-            # Add domain-specific resources from research
-            for domain in user_inputs.domains:
-                domain_title = domain.replace('_', ' ').title()
-                plan += f"**{domain_title} Resources:**\n"
-
-                if domain in research_data.get('domains', {}):
-                    domain_data = research_data['domains'][domain]
-
-                    # Add current interview guides
-                    if domain_data.get('current_guides', {}).get('success'):
-                        current_guides = domain_data['current_guides']['results'][:2]
-                        for guide in current_guides:
-                            if guide.get('url') and guide.get('title'):
-                                plan += f"- [📖 {guide['title'][:50]}...]({guide['url']})\n"
-                                resource_count += 1
-
-                    # Add interview preparation resources
-                    if domain_data.get('interview_info', {}).get('success'):
-                        interview_resources = domain_data['interview_info']['results'][:2]
-                        for resource in interview_resources:
-                            if resource.get('url') and resource.get('title'):
-                                plan += f"- [📚 {resource['title'][:50]}...]({resource['url']})\n"
-                                resource_count += 1
-
-                    # Add YouTube resources
-                    if domain_data.get('youtube_resources', {}).get('success'):
-                        youtube_resources = domain_data['youtube_resources']['results'][:2]
-                        for resource in youtube_resources:
-                            if resource.get('url') and resource.get('title'):
-                                plan += f"- [🎥 {resource['title'][:50]}...]({resource['url']})\n"
-                                resource_count += 1
-
-                    # Add LeetCode problems for algorithms domain
-                    if domain == 'algorithms' and domain_data.get('leetcode_problems', {}).get('success'):
-                        leetcode_problems = domain_data['leetcode_problems']['results'][:3]
-                        for problem in leetcode_problems:
-                            if problem.get('url') and problem.get('title'):
-                                plan += f"- [💻 {problem['title'][:50]}...]({problem['url']})\n"
-                                resource_count += 1
-
-                plan += "\n"
-
-            # Add general practice platforms
-            plan += """**Popular Practice Platforms:**
-- LeetCode - Algorithm practice
-- System Design Primer - Architecture concepts
-- Pramp - Mock interviews
-- InterviewBit - Comprehensive prep
-
-"""
-
-            # Add daily schedule recommendation
-            if user_inputs.preference == 'coding_heavy':
-                plan += """💡 **Daily Schedule Recommendation**
-- 1.5 hours: Coding practice
-- 30 minutes: System design study
-- 30 minutes: Domain-specific learning
-"""
-            elif user_inputs.preference == 'theory_heavy':
-                plan += """💡 **Daily Schedule Recommendation**
-- 1 hour: Theory and concept study
-- 45 minutes: System design reading
-- 45 minutes: Coding practice
-"""
-            elif user_inputs.preference == 'project_based':
-                plan += """💡 **Daily Schedule Recommendation**
-- 1 hour: Project development
-- 30 minutes: Code review and optimization
-- 1 hour: Related theory study
-"""
-            else:  # balanced
-                plan += """💡 **Daily Schedule Recommendation**
-- 1 hour: Coding practice
-- 30 minutes: System design study
-- 30 minutes: Domain-specific learning
-"""
-
-            # Add note about web search
-            if resource_count > 0:
-                plan += f"\n**Note:** This plan includes {resource_count} current resources found through web search.\n"
-            else:
-                plan += "\n**Note:** This is a basic plan. For a more detailed, research-backed plan, please ensure web search is enabled.\n"
-
-            plan += """
-**Are you satisfied with this preparation plan, or would you like me to make any adjustments?**
-
-You can say:
-- **"I'm satisfied"** or **"This looks perfect!"** to complete
-- **"I want to adjust..."** to request specific changes
-
-What would you like to do next?"""
+        # Add note about web search
+        if resource_count > 0:
+            parts.append(f"\n**Note:** This plan includes {resource_count} current resources found through web search.\n")
+        else:
+            parts.append(_BASIC_PLAN_NOTE)
+
+        parts.append(_PLAN_FEEDBACK_PROMPT)
+
+        yield "".join(parts)
+
+    @staticmethod
+    def _render_domain_section(domain: str, domain_data: Optional[Dict[str, Any]]) -> tuple[str, int]:
+        """Render one domain's resources section; returns the text and the number of links."""
+        parts: List[str] = [f"**{display_name(domain)} Resources:**\n"]
+
+        if domain_data is not None:
+            for key, icon, limit in _DOMAIN_RESOURCE_SECTIONS:
+                # LeetCode problems are only listed for the algorithms domain
+                if key == 'leetcode_problems' and domain != 'algorithms':
+                    continue
+                section = domain_data.get(key, {})
+                if section.get('success'):
+                    parts.extend(
+                        f"- [{icon} {title[:50]}...]({url})\n"
+                        for url, title in _valid_links(islice(section['results'], limit))
+                    )
+
+        # Everything after the heading is one link
+        resource_count = len(parts) - 1
+        parts.append("\n")
+        return "".join(parts), resource_count
 
-            return plan
+    async def create_preparation_plan(
+        self,
+        user_inputs: UserInputs,
+        research_data: Dict[str, Any]
+    ) -> str:
+        """Create a comprehensive preparation plan based on user inputs and research."""
+        try:
+            if len(user_inputs.domains) >= self.thread_render_min_domains:
+                # Large plans render off the event loop so other requests keep flowing
+                return await asyncio.to_thread(self.render_preparation_plan, user_inputs, research_data)
+            return self.render_preparation_plan(user_inputs, research_data)
 
         except Exception as e:
-            logger.error(f"Error creating preparation plan: {e}")
+            logger.error("Error creating preparation plan: %s", e)
             return f"I encountered an error creating your plan: {str(e)}. Please try again."
 
     SUPPORTED_CONTENT_TYPES = ['text', 'text/plain']
@@ -1,6 +1,8 @@
-import logging
 import asyncio
-from typing import Dict, Any, Optional, List
+import hashlib
+import logging
+import re
+from typing import Awaitable, Callable, Dict, Any, Optional, List, TypeVar
 import httpx
 
 from a2a.server.agent_execution import AgentExecutor, RequestContext
@@ -21,12 +23,71 @@ from a2a.utils import (
 )
 from a2a.utils.errors import ServerError
 
-from .interview_prep_agent import InterviewPrepAgent
-from .conversation_state import ConversationPhase, ConversationState, UserInputs
+# Same confirmation rule as the agent's ready-to-process handler
+from .interview_prep_agent import InterviewPrepAgent, is_confirmation
+from .conversation_state import PHASE, ConversationState, UserInputs, display_name
 from .web_search_tools import WebSearchManager
+from .serialization import dumps
 
 logger = logging.getLogger(__name__)
 
+try:
+    from .push_notification_handler import InterviewPrepPushNotificationHandler
+    _HAS_PUSH = True
+except ImportError as e:
+    logger.warning("Push notification handler not available: %s", e)
+    InterviewPrepPushNotificationHandler = None
+    _HAS_PUSH = False
+
+T = TypeVar('T')
+
+# Refinement recommendations by keyword, in priority order
+_REFINEMENT_RECOMMENDATIONS = {
+    'system design': "- 🏗️ Additional system design practice with real-world scenarios",
+    'algorithm': "- 🧮 Enhanced algorithm problem-solving with complexity analysis",
+    'timeline': "- ⏰ Adjusted timeline to better fit your schedule",
+    'time': "- ⏰ Adjusted timeline to better fit your schedule",
+    'company': "- 🏢 Company-specific interview preparation and insights",
+}
+# One scan finds every keyword; the lookahead lets matches overlap
+_REFINEMENT_KEYWORD_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(keyword) for keyword in _REFINEMENT_RECOMMENDATIONS) + '))',
+    re.IGNORECASE
+)
+
+# Static sections of the refined plan, around the refinement recommendations
+_REFINED_SCHEDULE = """
+
+### Weeks 4-6: Enhanced Skill Development
+- Targeted practice based on your feedback
+- Advanced problem-solving techniques
+- Specialized resources and materials
+
+### Weeks 7-9: Advanced Topics (Refined)
+- Complex scenarios and case studies
+- Industry-specific preparation
+- Mock interview intensification
+
+### Weeks 10-12: Final Preparation (Customized)
+- Personalized company preparation
+- Last-minute optimization
+- Confidence building exercises
+
+## 🎯 Refinement-Specific Recommendations
+
+"""
+
+_REFINED_FOOTER = """
+
+## 📈 Updated Progress Tracking
+- Weekly milestone checks
+- Refined success metrics
+- Adjusted timeline based on feedback
+
+---
+*This refined plan incorporates your specific feedback and preferences. Further adjustments can be made as needed.*
+"""
+
 
 class InterviewPrepAgentExecutor(AgentExecutor):
     """
@@ -34,17 +95,16 @@ class InterviewPrepAgentExecutor(AgentExecutor):
     """
 
     def __init__(self, httpx_client: httpx.AsyncClient):
+        # Expected to be the shared pooled HTTP/2 client from create_httpx_client()
         self.agent = InterviewPrepAgent()
         self.search_manager = WebSearchManager()
         self.httpx_client = httpx_client
+        # Research runs in flight, keyed by a fingerprint of their inputs
+        self._inflight: Dict[str, asyncio.Task] = {}
 
-        # Import push notification handler
-        try:
-            from .push_notification_handler import InterviewPrepPushNotificationHandler
-            self.push_notification_handler = InterviewPrepPushNotificationHandler(httpx_client)
-        except ImportError as e:
-            logger.warning(f"Push notification handler not available: {e}")
-            self.push_notification_handler = None
+        self.push_notification_handler = (
+            InterviewPrepPushNotificationHandler(httpx_client) if _HAS_PUSH else None
+        )
 
         logger.info("InterviewPrepAgentExecutor initialized")
 
@@ -112,13 +172,13 @@ class InterviewPrepAgentExecutor(AgentExecutor):
 
         try:
             async for item in self.agent.stream(query, task.context_id):
-                is_task_complete = item.get('is_task_complete', False)
-                require_user_input = item.get('require_user_input', False)
-                content = item.get('content', '')
-                phase = item.get('phase', '')
+                is_task_complete = item.is_task_complete
+                require_user_input = item.require_user_input
+                content = item.content
+                phase = item.phase
 
                 # Check if we need to start async processing
-                if item.get('trigger_async_processing') or item.get('trigger_push_notification'):
+                if item.trigger_async_processing:
                     logger.info("User confirmed processing - transitioning to async mode")
 
                     # Return "submitted" status immediately to the user
@@ -134,7 +194,7 @@ class InterviewPrepAgentExecutor(AgentExecutor):
                     return  # End standard processing, let async mode take over
 
                 # Check if we need to start refinement processing
-                elif item.get('trigger_refinement_processing'):
+                elif item.trigger_refinement_processing:
                     logger.info("Starting refinement processing")
 
                     # Update status to working
@@ -148,11 +208,11 @@ class InterviewPrepAgentExecutor(AgentExecutor):
                     )
 
                     # Perform refinement
-                    refined_plan = await self._generate_refined_plan(task.context_id)
+                    sections = await self._generate_refined_plan_sections(task.context_id)
 
-                    # Complete with the refined plan
+                    # Complete with the refined plan, one text part per section
                     await updater.add_artifact(
-                        [Part(root=TextPart(text=refined_plan))],
+                        [Part(root=TextPart(text=section)) for section in sections],
                         name='refined_interview_preparation_plan',
                     )
                     await updater.complete()
@@ -216,16 +276,9 @@ class InterviewPrepAgentExecutor(AgentExecutor):
         if should_start_async:
             logger.info("Starting async processing with push notifications")
 
-            # Send "submitted" status
-            submitted_message = new_agent_text_message(
-                "Great! I'm working on your personalized interview prep plan. This will take about 1-2 minutes.",
-                task.context_id,
-                task.id,
-            )
-            await updater.update_status(TaskState.submitted, submitted_message)
-
-            # Send "working" status
+            # Go straight to "working"; a separate "submitted" update only adds a round trip
             working_message = new_agent_text_message(
+                "Great! I'm working on your personalized interview prep plan. This will take about 1-2 minutes.\n\n"
                 "..Searching for the best interview resources and study materials for you...",
                 task.context_id,
                 task.id,
@@ -265,14 +318,14 @@ class InterviewPrepAgentExecutor(AgentExecutor):
 
             # Only trigger async processing when user explicitly confirms processing
             # AND we have all required inputs (ready_to_process phase)
-            if conversation_state.phase == ConversationPhase.READY_TO_PROCESS:
+            if conversation_state.phase == PHASE.READY_TO_PROCESS:
                 # Check if user is confirming to start processing
-                if any(word in query.lower() for word in ['yes', 'start', 'create', 'begin', 'proceed']):
+                if is_confirmation(query):
                     logger.info(f"User confirmed processing in ready_to_process phase: {query}")
                     return True
 
             # Also trigger for refinement processing
-            if conversation_state.phase == ConversationPhase.REFINEMENT_PROCESSING:
+            if conversation_state.phase == PHASE.REFINEMENT_PROCESSING:
                 return True
 
             return False
@@ -281,6 +334,36 @@ class InterviewPrepAgentExecutor(AgentExecutor):
             logger.error(f"Error checking async processing condition: {e}")
             return False
 
+    async def _single_flight(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """Run factory() once per key at a time; concurrent callers share its result.
+
+        The shared run is shielded, so cancelling one caller does not cancel
+        it for the others.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _research(
+        self,
+        domains: List[str],
+        skill_level: str,
+        companies: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Comprehensive research, shared between identical concurrent requests."""
+        key = hashlib.blake2b(dumps([domains, skill_level, companies or []]), digest_size=16).hexdigest()
+        return await self._single_flight(
+            key,
+            lambda: self.search_manager.comprehensive_research(
+                domains=domains,
+                skill_level=skill_level,
+                companies=companies
+            )
+        )
+
     async def _async_research_and_generate(self, query: str, context_id: str, request_metadata: Dict[str, Any] = None):
         """
         Async generator for research and plan generation with progress updates.
@@ -304,16 +387,17 @@ class InterviewPrepAgentExecutor(AgentExecutor):
                 'content': '🔍 Collecting latest interview resources and trends...',
             }
 
-            # Simulate research delay and perform actual research
-            await asyncio.sleep(10)  # 10 seconds for domain research
-
+            # Perform the research
             research_data = {}
             if conversation_state.user_inputs.domains:
-                research_data = await self.search_manager.comprehensive_research(
+                research_data = await self._research(
                     domains=conversation_state.user_inputs.domains,
                     skill_level=conversation_state.user_inputs.skill_level or 'intermediate',
                     companies=conversation_state.user_inputs.specific_companies
                 )
+                if research_data.get('success'):
+                    # Kept on the state so refinement can reuse it
+                    conversation_state.research_data = research_data.get('research_data', {})
 
             # Step 2: Plan generation
             yield {
@@ -322,8 +406,6 @@ class InterviewPrepAgentExecutor(AgentExecutor):
                 'content': '📋 Generating personalized study plan based on your preferences...',
             }
 
-            await asyncio.sleep(15)  # 15 seconds for plan generation
-
             # Generate the preparation plan
             if research_data.get('success'):
                 plan_content = await self.agent.create_preparation_plan(
@@ -340,12 +422,10 @@ class InterviewPrepAgentExecutor(AgentExecutor):
                 'content': '✨ Finalizing your interview preparation roadmap...',
             }
 
-            await asyncio.sleep(5)  # 5 seconds for finalization
-
             # Update conversation state with the plan
             conversation_state.plan_content = plan_content
             conversation_state.plan_generated = True
-            conversation_state.advance_phase(ConversationPhase.PLAN_DELIVERED)
+            conversation_state.advance_phase(PHASE.PLAN_DELIVERED)
             await self.agent._save_conversation_state(context_id, conversation_state)
 
             # Extract email ID from metadata
@@ -394,7 +474,7 @@ What would you like to do next?"""
             # Perform quick research
             research_data = {}
             if conversation_state.user_inputs.domains:
-                research_data = await self.search_manager.comprehensive_research(
+                research_data = await self._research(
                     domains=conversation_state.user_inputs.domains,
                     skill_level=conversation_state.user_inputs.skill_level or 'intermediate'
                 )
@@ -416,6 +496,15 @@ What would you like to do next?"""
 
     async def _generate_refined_plan(self, context_id: str) -> str:
         """Generate refined preparation plan based on user feedback."""
+        return "".join(await self._generate_refined_plan_sections(context_id))
+
+    async def _generate_refined_plan_sections(self, context_id: str) -> List[str]:
+        """
+        Generate the refined plan as its top-level sections, in order.
+
+        Joined, the sections form the refined plan; each one can be sent as its
+        own artifact part.
+        """
         try:
             conversation_state = await self.agent._get_conversation_state(context_id)
 
@@ -423,116 +512,89 @@ What would you like to do next?"""
             refinements = conversation_state.refinement_requests
             original_plan = conversation_state.plan_content or "Previous plan"
 
-            # Perform research based on refinements
-            research_data = {}
-            if conversation_state.user_inputs.domains:
-                research_data = await self.search_manager.comprehensive_research(
+            # Reuse the research from the initial plan when there is one
+            research_data = conversation_state.research_data
+            if not research_data and conversation_state.user_inputs.domains:
+                research_result = await self._research(
                     domains=conversation_state.user_inputs.domains,
                     skill_level=conversation_state.user_inputs.skill_level or 'intermediate'
                 )
+                if research_result.get('success'):
+                    research_data = research_result.get('research_data', {})
 
             # Generate refined plan incorporating feedback
             refinement_summary = "\n".join([f"- {req}" for req in refinements])
 
-            refined_plan = f"""# 🎯 Your Refined Interview Preparation Plan
+            user_inputs = conversation_state.user_inputs
+            parts: List[str] = [f"""# 🎯 Your Refined Interview Preparation Plan
 
 ## 📝 Refinements Applied
 Based on your feedback:
 {refinement_summary}
 
 ## 📋 Updated Overview
-- **Domains:** {", ".join([d.replace('_', ' ').title() for d in conversation_state.user_inputs.domains])}
-- **Skill Level:** {conversation_state.user_inputs.skill_level.replace('_', ' ').title() if conversation_state.user_inputs.skill_level else 'Intermediate'}
-- **Learning Style:** {conversation_state.user_inputs.preference.replace('_', ' ').title() if conversation_state.user_inputs.preference else 'Balanced'}
+- **Domains:** {user_inputs.domains_display}
+- **Skill Level:** {display_name(user_inputs.skill_level) if user_inputs.skill_level else 'Intermediate'}
+- **Learning Style:** {display_name(user_inputs.preference) if user_inputs.preference else 'Balanced'}
 
 ## 🔄 Adjusted 12-Week Preparation Schedule
 
 ### Weeks 1-3: Foundation Building (Updated)
-"""
+"""]
 
             # Add domain-specific content based on research and refinements
-            for domain in conversation_state.user_inputs.domains:
-                refined_plan += f"\n#### {domain.replace('_', ' ').title()}\n"
+            researched_domains = research_data.get('domains', {})
+            for domain in user_inputs.domains:
+                parts.append(f"\n#### {display_name(domain)}\n")
 
-                if domain in research_data.get('domains', {}):
-                    domain_data = research_data['domains'][domain]
+                if domain in researched_domains:
+                    domain_data = researched_domains[domain]
 
                     # Add learning resources
                     if domain_data.get('learning_resources', {}).get('success'):
                         resources = domain_data['learning_resources']['results'][:3]
                         for resource in resources:
-                            refined_plan += f"- 📚 {resource.get('title', 'Resource')}\n"
-
-            refined_plan += f"""
-
-### Weeks 4-6: Enhanced Skill Development
-- Targeted practice based on your feedback
-- Advanced problem-solving techniques
-- Specialized resources and materials
-
-### Weeks 7-9: Advanced Topics (Refined)
-- Complex scenarios and case studies
-- Industry-specific preparation
-- Mock interview intensification
+                            parts.append(f"- 📚 {resource.get('title', 'Resource')}\n")
 
-### Weeks 10-12: Final Preparation (Customized)
-- Personalized company preparation
-- Last-minute optimization
-- Confidence building exercises
-
-## 🎯 Refinement-Specific Recommendations
-
-{self._generate_refinement_recommendations(refinements)}
-
-## 📈 Updated Progress Tracking
-- Weekly milestone checks
-- Refined success metrics
-- Adjusted timeline based on feedback
-
----
-*This refined plan incorporates your specific feedback and preferences. Further adjustments can be made as needed.*
-"""
+            sections = [
+                "".join(parts),
+                _REFINED_SCHEDULE + self._generate_refinement_recommendations(refinements),
+                _REFINED_FOOTER,
+            ]
+            refined_plan = "".join(sections)
 
             # Store the refined plan
             conversation_state.plan_content = refined_plan
             await self.agent._save_conversation_state(context_id, conversation_state)
 
-            return refined_plan
+            return sections
 
         except Exception as e:
             logger.error(f"Error generating refined plan: {e}")
-            return f"I encountered an error refining your plan: {str(e)}. Please try again."
+            return [f"I encountered an error refining your plan: {str(e)}. Please try again."]
 
     def _generate_refinement_recommendations(self, refinements: List[str]) -> str:
         """Generate specific recommendations based on refinement requests."""
         recommendations = []
 
         for refinement in refinements:
-            refinement_lower = refinement.lower()
-
-            if 'system design' in refinement_lower:
-                recommendations.append("- 🏗️ Additional system design practice with real-world scenarios")
-            elif 'algorithm' in refinement_lower:
-                recommendations.append("- 🧮 Enhanced algorithm problem-solving with complexity analysis")
-            elif 'timeline' in refinement_lower or 'time' in refinement_lower:
-                recommendations.append("- ⏰ Adjusted timeline to better fit your schedule")
-            elif 'company' in refinement_lower:
-                recommendations.append("- 🏢 Company-specific interview preparation and insights")
-            else:
-                recommendations.append(f"- 🔧 Customization based on: {refinement}")
+            matched = {match.group(1).lower() for match in _REFINEMENT_KEYWORD_RE.finditer(refinement)}
+            recommendation = next(
+                (text for keyword, text in _REFINEMENT_RECOMMENDATIONS.items() if keyword in matched),
+                None
+            )
+            recommendations.append(recommendation or f"- 🔧 Customization based on: {refinement}")
 
         return "\n".join(recommendations) if recommendations else "- 🎯 General optimizations applied"
 
     async def _generate_fallback_plan(self, user_inputs: UserInputs) -> str:
         """Generate a fallback plan when web search fails."""
-        domains_str = ", ".join([d.replace('_', ' ').title() for d in user_inputs.domains])
-
         return f"""# 🎯 Your Interview Preparation Plan
 
 ## 📋 Overview
-- **Domains:** {domains_str}
-- **Skill Level:** {user_inputs.skill_level.replace('_', ' ').title() if user_inputs.skill_level else 'Intermediate'}
-- **Learning Style:** {user_inputs.preference.replace('_', ' ').title() if user_inputs.preference else 'Balanced'}
+- **Domains:** {user_inputs.domains_display}
+- **Skill Level:** {display_name(user_inputs.skill_level) if user_inputs.skill_level else 'Intermediate'}
+- **Learning Style:** {display_name(user_inputs.preference) if user_inputs.preference else 'Balanced'}
 
 ## 📅 8-Week Preparation Schedule
 
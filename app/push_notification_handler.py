@@ -1,11 +1,15 @@
 import asyncio
+import hashlib
+import hmac
 import os
 import logging
 import uuid
+from functools import lru_cache
 from typing import Any, Dict, Optional
 import httpx
 from urllib.parse import urlparse
 
+from a2a.server.tasks import BasePushNotificationSender, PushNotificationConfigStore
 from a2a.types import (
     Task,
     TaskState,
@@ -19,8 +23,81 @@ from a2a.types import (
 )
 from a2a.utils import new_agent_text_message
 
+from .serialization import dumps
+
+try:
+    import aiohttp
+except ImportError:  # only needed for PUSH_CALLBACK_TRANSPORT=aiohttp
+    aiohttp = None
+
 logger = logging.getLogger(__name__)
 
+# Failures _send_callback logs instead of raising, for either transport
+_CALLBACK_TIMEOUT_ERRORS = (httpx.TimeoutException, asyncio.TimeoutError)
+_CALLBACK_REQUEST_ERRORS = (httpx.RequestError,) + ((aiohttp.ClientError,) if aiohttp else ())
+
+
+# Callback URLs repeat per client, so URL handling is memoized. The base URL is
+# part of the key, so a changed BASE_API_URL resolves afresh.
+@lru_cache(maxsize=1024)
+def _resolve_callback_url_cached(callback_url: str, base_api_url: str) -> str:
+    """Replace the BASE_API_URL placeholder in a callback URL."""
+    # Check if URL contains BASE_API_URL/ pattern
+    if "BASE_API_URL/" not in callback_url:
+        return callback_url
+
+    # Remove trailing slash from base_api_url if present
+    return callback_url.replace('BASE_API_URL', base_api_url.rstrip('/'))
+
+
+@lru_cache(maxsize=1024)
+def _validate_callback_url_cached(url: str) -> bool:
+    """Check that a callback URL is http(s) with a hostname."""
+    try:
+        parsed = urlparse(url)
+
+        # Must be HTTPS in production
+        if parsed.scheme not in ['http', 'https']:
+            return False
+
+        # Must have valid hostname
+        if not parsed.hostname:
+            return False
+
+        # Block localhost/private IPs in production
+        # (For demo purposes, we'll allow localhost)
+
+        return True
+    except Exception:
+        return False
+
+
+@lru_cache(maxsize=1024)
+def _callback_http_url(callback_url: str) -> httpx.URL:
+    """Parse a callback URL once; httpx.URL is immutable, so it can be shared."""
+    return httpx.URL(callback_url)
+
+
+# Fields shared by every pushNotifications/send request
+_RPC_ENVELOPE = {"jsonrpc": "2.0", "method": "pushNotifications/send"}
+
+
+# Constant parts of the metadata attached to final and error callbacks
+_PROCESSING_SUMMARY = {
+    'total_steps': 0,
+    'processing_duration_estimate': '2-3 minutes',
+    'agent_type': 'interview_preparation'
+}
+_ERROR_INFO = {
+    'error_message': '',
+    'agent_type': 'interview_preparation',
+    'error_occurred_at': 'async_processing'
+}
+
+
+def _jsonrpc_payload(task_payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Wrap a dumped Task in a JSON-RPC 2.0 pushNotifications/send request."""
+    return {**_RPC_ENVELOPE, "params": {"task": task_payload}, "id": uuid.uuid4().hex}
 
 class InterviewPrepPushNotificationSettings:
     """Configuration for interview prep push notifications from environment variables."""
@@ -44,7 +121,21 @@ class InterviewPrepPushNotificationSettings:
         # Progress update intervals for long processing
         self.progress_update_interval = int(os.getenv('PROGRESS_UPDATE_INTERVAL_SECONDS', '10'))
 
-        logger.info(f"Interview prep push notifications configured: enabled={self.enabled}, mode={self.mode}, delay={self.processing_delay}s")
+        # Maximum number of plan runs processed in the background at once
+        self.max_background_jobs = int(os.getenv('PUSH_MAX_BACKGROUND_JOBS', '32'))
+
+        # HTTP stack used for callback POSTs: 'httpx' (shared client) or 'aiohttp'
+        self.callback_transport = os.getenv('PUSH_CALLBACK_TRANSPORT', 'httpx').lower()
+
+        # Base URL substituted for the BASE_API_URL callback placeholder
+        self.base_api_url = os.getenv('BASE_API_URL')
+
+        # JWT sent with callbacks, with its Authorization values prebuilt
+        self.callback_jwt = os.getenv('A2A_CALLBACK_TOKEN')
+        self.bearer_authorization = f"Bearer {self.callback_jwt}"
+        self.basic_authorization = f"Basic {self.callback_jwt}"
+
+        logger.info("Interview prep push notifications configured: enabled=%s, mode=%s, delay=%ss", self.enabled, self.mode, self.processing_delay)
 
 
 class InterviewPrepPushNotificationHandler:
@@ -53,6 +144,24 @@ class InterviewPrepPushNotificationHandler:
     def __init__(self, httpx_client: httpx.AsyncClient):
         self.client = httpx_client
         self.settings = InterviewPrepPushNotificationSettings()
+        # Strong references to detached runs so they are not garbage collected
+        # mid-flight; the semaphore caps how many of them run at once
+        self._background_tasks: set[asyncio.Task] = set()
+        self._job_slots = asyncio.Semaphore(self.settings.max_background_jobs)
+        # Webhook secret encoded once for HMAC signing
+        self._secret_bytes = self.settings.webhook_secret.encode() if self.settings.webhook_secret else None
+        # Optional aiohttp transport for callbacks; the shared httpx client otherwise
+        self._use_aiohttp = self.settings.callback_transport == 'aiohttp'
+        if self._use_aiohttp and aiohttp is None:
+            logger.warning("PUSH_CALLBACK_TRANSPORT=aiohttp but aiohttp is not installed; using httpx")
+            self._use_aiohttp = False
+        self._aiohttp_session: Optional["aiohttp.ClientSession"] = None
+
+        # Headers common to every callback; orjson bodies are always UTF-8
+        self._base_headers = {
+            "Content-Type": "application/json; charset=utf-8",
+            "User-Agent": "A2A-InterviewPrep-Agent/1.0"
+        }
 
     async def handle_push_notification_request(
         self,
@@ -79,8 +188,8 @@ class InterviewPrepPushNotificationHandler:
             return
 
         # Debug: Log incoming task metadata and request metadata
-        logger.info(f"Incoming task metadata: {task.metadata}")
-        logger.info(f"Incoming request metadata: {request_metadata}")
+        logger.debug("Incoming task metadata: %s", task.metadata)
+        logger.debug("Incoming request metadata: %s", request_metadata)
 
         # Extract webhook configuration
         callback_url = webhook_config.url
@@ -93,71 +202,60 @@ class InterviewPrepPushNotificationHandler:
 
         # Replace BASE_API_URL placeholder with environment variable if present
         callback_url = self._resolve_callback_url(callback_url)
-        logger.info(f"Resolved callback URL: {callback_url}")
+        logger.info("Resolved callback URL: %s", callback_url)
 
         # Validate callback URL
         if not self._validate_callback_url(callback_url):
-            logger.error(f"Invalid callback URL: {callback_url}")
+            logger.error("Invalid callback URL: %s", callback_url)
             return
 
         # Start background processing with progress updates
-        asyncio.create_task(
-            self._process_async_interview_prep_request(
-                task=task,
-                callback_url=callback_url,
-                webhook_token=webhook_token,
-                auth_config=auth_config,
-                agent_response_generator=agent_response_generator,
-                query=query,
-                context_id=context_id,
-                request_metadata=request_metadata
-            )
+        background_task = asyncio.create_task(
+            self._run_background_job(
+                self._process_async_interview_prep_request(
+                    task=task,
+                    callback_url=callback_url,
+                    webhook_token=webhook_token,
+                    auth_config=auth_config,
+                    agent_response_generator=agent_response_generator,
+                    query=query,
+                    context_id=context_id,
+                    request_metadata=request_metadata
+                )
+            ),
+            name=f"ip-push-{task.id}"
         )
+        self._background_tasks.add(background_task)
+        background_task.add_done_callback(self._background_tasks.discard)
+
+    async def _run_background_job(self, job) -> None:
+        """Run a detached plan job once a background slot is free."""
+        async with self._job_slots:
+            await job
 
     def _resolve_callback_url(self, callback_url: str) -> str:
         """
         Resolve callback URL by replacing BASE_API_URL placeholder with environment variable.
         """
-        # Check if URL contains BASE_API_URL/ pattern
-        if "BASE_API_URL/" in callback_url:
-            # Get the actual base API URL from environment variable
-            base_api_url = os.getenv('BASE_API_URL')
+        # Get the actual base API URL from environment variable
+        base_api_url = self.settings.base_api_url
 
-            if base_api_url:
-                # Remove trailing slash from base_api_url if present
-                base_api_url = base_api_url.rstrip('/')
+        if base_api_url:
+            # Resolution (placeholder check included) is cached per distinct URL
+            resolved_url = _resolve_callback_url_cached(callback_url, base_api_url)
+            if resolved_url != callback_url:
+                logger.info("Replaced BASE_API_URL placeholder: %s -> %s", callback_url, resolved_url)
+            return resolved_url
 
-                # Replace the placeholder with the actual URL
-                resolved_url = callback_url.replace('BASE_API_URL', base_api_url)
-
-                logger.info(f"Replaced BASE_API_URL placeholder: {callback_url} -> {resolved_url}")
-                return resolved_url
-            else:
-                logger.warning("BASE_API_URL environment variable not set, but callback URL contains BASE_API_URL placeholder")
-                return callback_url
+        if "BASE_API_URL/" in callback_url:
+            logger.warning("BASE_API_URL environment variable not set, but callback URL contains BASE_API_URL placeholder")
 
         # Return original URL if no replacement needed
         return callback_url
 
     def _validate_callback_url(self, url: str) -> bool:
         """Validate callback URL for security."""
-        try:
-            parsed = urlparse(url)
-
-            # Must be HTTPS in production
-            if parsed.scheme not in ['http', 'https']:
-                return False
-
-            # Must have valid hostname
-            if not parsed.hostname:
-                return False
-
-            # Block localhost/private IPs in production
-            # (For demo purposes, we'll allow localhost)
-
-            return True
-        except Exception:
-            return False
+        return _validate_callback_url_cached(url)
 
     async def _process_async_interview_prep_request(
         self,
@@ -171,7 +269,21 @@ class InterviewPrepPushNotificationHandler:
         request_metadata: Dict[str, Any] = None
     ) -> None:
         """Process the interview preparation request asynchronously with progress updates."""
-        progress_steps = []
+        progress_count = 0
+        # Progress text is queued and posted by a single flusher, so steps that
+        # arrive within one update interval share a callback
+        progress_queue: asyncio.Queue[Optional[str]] = asyncio.Queue()
+        progress_flusher = asyncio.create_task(
+            self._flush_progress_updates(
+                progress_queue,
+                task=task,
+                callback_url=callback_url,
+                auth_config=auth_config,
+                webhook_token=webhook_token,
+                context_id=context_id,
+                request_metadata=request_metadata
+            )
+        )
 
         try:
             # Add initial processing delay
@@ -186,34 +298,22 @@ class InterviewPrepPushNotificationHandler:
                 is_complete = response.get('is_task_complete', False)
                 require_input = response.get('require_user_input', False)
 
-                # Store progress step
-                progress_steps.append({
-                    'content': progress_content,
-                    'timestamp': asyncio.get_event_loop().time(),
-                    'is_complete': is_complete,
-                    'require_input': require_input
-                })
+                # Only the number of steps is reported back
+                progress_count += 1
 
-                # Send progress update for non-final responses
+                # Queue progress update for non-final responses
                 if not is_complete and not require_input and progress_content:
-                    await self._send_progress_update(
-                        task=task,
-                        callback_url=callback_url,
-                        auth_config=auth_config,
-                        webhook_token=webhook_token,
-                        progress_content=progress_content,
-                        context_id=context_id,
-                        request_metadata=request_metadata
-                    )
-
-                    # Add delay between progress updates
-                    await asyncio.sleep(self.settings.progress_update_interval)
+                    progress_queue.put_nowait(progress_content)
 
                 # If this is the final response, prepare for completion
                 if is_complete or require_input:
                     final_response = response
                     break
 
+            # Deliver any queued progress before the final callback
+            progress_queue.put_nowait(None)
+            await progress_flusher
+
             # If no final response was captured, create a default one
             if 'final_response' not in locals():
                 final_response = {
@@ -228,7 +328,7 @@ class InterviewPrepPushNotificationHandler:
                 response=final_response,
                 context_id=context_id,
                 request_metadata=request_metadata,
-                progress_steps=progress_steps
+                progress_count=progress_count
             )
 
             # Send final callback
@@ -242,7 +342,8 @@ class InterviewPrepPushNotificationHandler:
             logger.info("Interview preparation async processing completed successfully")
 
         except Exception as e:
-            logger.error(f"Error processing async interview prep request: {e}")
+            logger.error("Error processing async interview prep request: %s", e)
+            progress_flusher.cancel()
 
             # Send error callback
             error_payload = self._create_error_callback_payload(
@@ -260,7 +361,37 @@ class InterviewPrepPushNotificationHandler:
                     webhook_token=webhook_token
                 )
             except Exception as callback_error:
-                logger.error(f"Failed to send error callback: {callback_error}")
+                logger.error("Failed to send error callback: %s", callback_error)
+
+    async def _flush_progress_updates(
+        self,
+        progress_queue: asyncio.Queue[Optional[str]],
+        **update_kwargs: Any
+    ) -> None:
+        """
+        Post queued progress text until a None sentinel arrives.
+
+        Each step is sent as soon as it is queued; steps that arrive while a
+        send is still in flight are joined and sent together as one update.
+        """
+        while True:
+            content = await progress_queue.get()
+            if content is None:
+                return
+
+            batch = [content]
+            done = False
+            # Pick up anything queued during the previous send
+            while not progress_queue.empty():
+                content = progress_queue.get_nowait()
+                if content is None:
+                    done = True
+                    break
+                batch.append(content)
+
+            await self._send_progress_update(progress_content="\n".join(batch), **update_kwargs)
+            if done:
+                return
 
     async def _send_progress_update(
         self,
@@ -285,28 +416,20 @@ class InterviewPrepPushNotificationHandler:
             final_metadata = request_metadata if request_metadata else task.metadata
 
             # Create updated task for progress
-            updated_task = Task(
-                id=task.id,
-                kind=task.kind,
+            updated_task = self._task_snapshot(
+                task,
                 context_id=context_id,
                 status=TaskStatus(
                     state=TaskState.working,
                     message=progress_message
                 ),
-                history=task.history + [progress_message] if task.history else [progress_message],
+                message=progress_message,
                 metadata=final_metadata
             )
 
             # Create JSON-RPC payload for progress update
-            task_payload = updated_task.model_dump(exclude_none=True)
-            jsonrpc_payload = {
-                "jsonrpc": "2.0",
-                "method": "pushNotifications/send",
-                "params": {
-                    "task": task_payload
-                },
-                "id": str(uuid.uuid4())
-            }
+            task_payload = updated_task.model_dump(mode='json', exclude_none=True)
+            jsonrpc_payload = _jsonrpc_payload(task_payload)
 
             # Send progress update
             await self._send_callback(
@@ -316,10 +439,33 @@ class InterviewPrepPushNotificationHandler:
                 webhook_token=webhook_token
             )
 
-            logger.info(f"Sent progress update: {progress_content[:50]}...")
+            logger.info("Sent progress update: %s...", progress_content[:50])
 
         except Exception as e:
-            logger.error(f"Failed to send progress update: {e}")
+            logger.error("Failed to send progress update: %s", e)
+
+    @staticmethod
+    def _task_snapshot(
+        task: Task,
+        context_id: str,
+        status: TaskStatus,
+        message: Message,
+        metadata: Optional[Dict[str, Any]],
+        artifacts: Optional[list] = None
+    ) -> Task:
+        """
+        Copy the task with a new status and one more history message.
+
+        model_copy skips re-validating the unchanged fields and messages that a
+        fresh Task(...) would re-check on every callback.
+        """
+        return task.model_copy(update={
+            'context_id': context_id,
+            'status': status,
+            'history': [*(task.history or ()), message],
+            'artifacts': artifacts,
+            'metadata': metadata,
+        })
 
     def _create_final_callback_payload(
         self,
@@ -327,7 +473,7 @@ class InterviewPrepPushNotificationHandler:
         response: Dict[str, Any],
         context_id: str,
         request_metadata: Dict[str, Any] = None,
-        progress_steps: list = None
+        progress_count: int = 0
     ) -> Dict[str, Any]:
         """Create final callback payload in JSON-RPC format."""
 
@@ -335,11 +481,8 @@ class InterviewPrepPushNotificationHandler:
         if response['is_task_complete']:
             state = TaskState.completed
         elif response['require_user_input']:
-            # Check if this is a satisfaction check (plan delivered)
-            if 'satisfied' in response.get('content', '').lower():
-                state = TaskState.input_required  # Awaiting satisfaction feedback
-            else:
-                state = TaskState.input_required
+            # Includes the satisfaction check after a plan is delivered
+            state = TaskState.input_required
         else:
             state = TaskState.working
 
@@ -362,47 +505,33 @@ class InterviewPrepPushNotificationHandler:
                 )
             ]
 
-        # Use request metadata if available, otherwise fall back to task metadata
-        final_metadata = request_metadata if request_metadata else task.metadata
-
-        # Add processing summary to metadata
-        if final_metadata is None:
-            final_metadata = {}
-
-        final_metadata['processing_summary'] = {
-            'total_steps': len(progress_steps) if progress_steps else 0,
-            'processing_duration_estimate': '2-3 minutes',
-            'agent_type': 'interview_preparation'
+        # Use request metadata if available, otherwise fall back to task metadata.
+        # Merged into a new dict so the caller's metadata is never mutated.
+        final_metadata = {
+            **(request_metadata or task.metadata or {}),
+            'processing_summary': {**_PROCESSING_SUMMARY, 'total_steps': progress_count},
         }
 
         # Update task with final status
-        updated_task = Task(
-            id=task.id,
-            kind=task.kind,
+        updated_task = self._task_snapshot(
+            task,
             context_id=context_id,
             status=TaskStatus(
                 state=state,
                 message=agent_message if state == TaskState.input_required else None
             ),
-            artifacts=artifacts,
-            history=task.history + [agent_message] if task.history else [agent_message],
-            metadata=final_metadata
+            message=agent_message,
+            metadata=final_metadata,
+            artifacts=artifacts
         )
 
         # Debug logging
-        logger.info(f"Final callback payload metadata: {final_metadata}")
-        task_payload = updated_task.model_dump(exclude_none=True)
-        logger.info(f"Task object for final JSON-RPC: {task_payload}")
+        logger.debug("Final callback payload metadata: %s", final_metadata)
+        task_payload = updated_task.model_dump(mode='json', exclude_none=True)
+        logger.debug("Task object for final JSON-RPC: %s", task_payload)
 
         # Wrap the Task object in JSON-RPC 2.0 format
-        jsonrpc_payload = {
-            "jsonrpc": "2.0",
-            "method": "pushNotifications/send",
-            "params": {
-                "task": task_payload
-            },
-            "id": str(uuid.uuid4())
-        }
+        jsonrpc_payload = _jsonrpc_payload(task_payload)
 
         return jsonrpc_payload
 
@@ -421,43 +550,29 @@ class InterviewPrepPushNotificationHandler:
             task.id
         )
 
-        # Use request metadata if available, otherwise fall back to task metadata
-        final_metadata = request_metadata if request_metadata else task.metadata
-
-        # Add error info to metadata
-        if final_metadata is None:
-            final_metadata = {}
-
-        final_metadata['error_info'] = {
-            'error_message': error_message,
-            'agent_type': 'interview_preparation',
-            'error_occurred_at': 'async_processing'
+        # Use request metadata if available, otherwise fall back to task metadata,
+        # and add error info without mutating either
+        final_metadata = {
+            **(request_metadata or task.metadata or {}),
+            'error_info': {**_ERROR_INFO, 'error_message': error_message},
         }
 
-        updated_task = Task(
-            id=task.id,
-            kind=task.kind,
+        updated_task = self._task_snapshot(
+            task,
             context_id=context_id,
             status=TaskStatus(
                 state=TaskState.input_required,
                 message=error_agent_message
             ),
-            history=task.history + [error_agent_message] if task.history else [error_agent_message],
+            message=error_agent_message,
             metadata=final_metadata
         )
 
         # Get the task payload
-        task_payload = updated_task.model_dump(exclude_none=True)
+        task_payload = updated_task.model_dump(mode='json', exclude_none=True)
 
         # Wrap the Task object in JSON-RPC 2.0 format
-        jsonrpc_payload = {
-            "jsonrpc": "2.0",
-            "method": "pushNotifications/send",
-            "params": {
-                "task": task_payload
-            },
-            "id": str(uuid.uuid4())
-        }
+        jsonrpc_payload = _jsonrpc_payload(task_payload)
 
         return jsonrpc_payload
 
@@ -470,65 +585,85 @@ class InterviewPrepPushNotificationHandler:
     ) -> None:
         """Send callback to client webhook URL."""
 
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "A2A-InterviewPrep-Agent/1.0"
-        }
+        # Shared template; copied only when this callback adds headers of its own
+        headers = self._base_headers
 
         # Add authentication headers
-        if auth_config:
-            auth_headers = self._get_auth_headers(auth_config)
-            headers.update(auth_headers)
+        auth_headers = self._get_auth_headers(auth_config) if auth_config else None
 
-        # Add webhook token if provided
-        if webhook_token:
-            headers["X-Webhook-Token"] = webhook_token
+        if auth_headers or webhook_token:
+            headers = {**headers, **(auth_headers or {})}
 
-        # Add signature if webhook secret is configured
-        if self.settings.webhook_secret:
-            # This would implement HMAC signature
-            # For demo purposes, we'll skip this
-            pass
+            # Add webhook token if provided
+            if webhook_token:
+                headers["X-Webhook-Token"] = webhook_token
 
         try:
-            logger.info(f"Sending JSON-RPC callback to {callback_url}")
-            logger.info(f"Callback headers: {headers}")
-            logger.info(f"JSON-RPC method: {payload.get('method', 'Unknown')}")
+            logger.info("Sending JSON-RPC callback to %s", callback_url)
+            logger.debug("Callback headers: %s", headers)
+            logger.debug("JSON-RPC method: %s", payload.get('method', 'Unknown'))
 
             # Print the EXACT JSON-RPC body being sent (for debugging)
-            import json
-            exact_json_body = json.dumps(payload, indent=2, default=str, ensure_ascii=False)
-            logger.debug(f"EXACT JSON-RPC CALLBACK BODY:\n{exact_json_body}")
-
-            # Ensure UTF-8 encoding by manually serializing with ensure_ascii=False
-            json_data = json.dumps(payload, default=str, ensure_ascii=False)
-            headers["Content-Type"] = "application/json; charset=utf-8"
-
-            response = await self.client.post(
-                callback_url,
-                content=json_data.encode('utf-8'),
-                headers=headers,
-                timeout=self.settings.callback_timeout
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                exact_json_body = dumps(payload, indent=True).decode('utf-8')
+                logger.debug("EXACT JSON-RPC CALLBACK BODY:\n%s", exact_json_body)
+
+            # orjson always emits UTF-8 without escaping non-ASCII text
+            json_data = dumps(payload)
+
+            # Add signature if webhook secret is configured, over the exact bytes sent
+            if self._secret_bytes:
+                signature = hmac.new(self._secret_bytes, json_data, hashlib.sha256).hexdigest()
+                headers = {**headers, "X-Webhook-Signature": f"sha256={signature}"}
+
+            if self._use_aiohttp:
+                session = self._get_aiohttp_session()
+                async with session.post(callback_url, data=json_data, headers=headers) as response:
+                    status_code = response.status
+                    response_text = await response.text() if status_code != 200 else ""
+            else:
+                request = self.client.build_request(
+                    "POST",
+                    _callback_http_url(callback_url),
+                    content=json_data,
+                    headers=headers,
+                    timeout=self.settings.callback_timeout
+                )
+                response = await self.client.send(request)
+                status_code = response.status_code
+                response_text = response.text if status_code != 200 else ""
 
-            if response.status_code == 200:
-                logger.info(f"Successfully sent callback to {callback_url}")
+            if status_code == 200:
+                logger.info("Successfully sent callback to %s", callback_url)
             else:
-                logger.warning(f"Callback returned status {response.status_code}: {response.text}")
+                logger.warning("Callback returned status %s: %s", status_code, response_text)
+
+        except _CALLBACK_TIMEOUT_ERRORS:
+            logger.error("Callback to %s timed out", callback_url)
+        except _CALLBACK_REQUEST_ERRORS as e:
+            logger.error("Failed to send callback to %s: %s", callback_url, e)
+
+    def _get_aiohttp_session(self) -> "aiohttp.ClientSession":
+        """Create the aiohttp callback session on first use, on the running loop."""
+        if self._aiohttp_session is None or self._aiohttp_session.closed:
+            self._aiohttp_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=20, keepalive_timeout=30),
+                timeout=aiohttp.ClientTimeout(total=self.settings.callback_timeout),
+            )
+        return self._aiohttp_session
 
-        except httpx.TimeoutException:
-            logger.error(f"Callback to {callback_url} timed out")
-        except httpx.RequestError as e:
-            logger.error(f"Failed to send callback to {callback_url}: {e}")
+    async def aclose(self) -> None:
+        """Close the aiohttp callback session, if one was opened."""
+        if self._aiohttp_session is not None:
+            await self._aiohttp_session.close()
+            self._aiohttp_session = None
 
     def _get_auth_headers(self, auth_config: PushNotificationAuthenticationInfo | None) -> Dict[str, str]:
         """Get authentication headers using JWT token from environment variable."""
         headers = {}
 
-        # Get JWT token from environment variable for callback authentication
-        jwt_token = os.getenv('A2A_CALLBACK_TOKEN')
-
-        if not jwt_token:
+        # JWT token from environment variable for callback authentication
+        if not self.settings.callback_jwt:
             logger.warning("A2A_CALLBACK_TOKEN environment variable not set. Callback authentication may fail.")
             return headers
 
@@ -536,14 +671,75 @@ class InterviewPrepPushNotificationHandler:
         if auth_config:
             schemes = getattr(auth_config, 'schemes', []) or []
             if 'Bearer' in schemes:
-                headers["Authorization"] = f"Bearer {jwt_token}"
-                logger.info("Added Bearer authentication header for callback")
+                headers["Authorization"] = self.settings.bearer_authorization
+                logger.debug("Added Bearer authentication header for callback")
             elif 'Basic' in schemes:
-                headers["Authorization"] = f"Basic {jwt_token}"
-                logger.info("Added Basic authentication header for callback")
+                headers["Authorization"] = self.settings.basic_authorization
+                logger.debug("Added Basic authentication header for callback")
         else:
             # Default to Bearer if no auth config specified
-            headers["Authorization"] = f"Bearer {jwt_token}"
-            logger.info("Added default Bearer authentication header for callback")
+            headers["Authorization"] = self.settings.bearer_authorization
+            logger.debug("Added default Bearer authentication header for callback")
 
         return headers
+
+
+class BatchingPushNotificationSender(BasePushNotificationSender):
+    """Push sender that coalesces bursts of task updates into fewer POSTs.
+
+    Updates are buffered for up to PUSH_BATCH_INTERVAL_MS, or until
+    PUSH_BATCH_MAX_EVENTS have queued, and then dispatched together. Every
+    notification carries the full task snapshot and A2A webhooks expect one
+    task per POST, so only the latest snapshot of each task is delivered.
+    """
+
+    def __init__(
+        self,
+        httpx_client: httpx.AsyncClient,
+        config_store: PushNotificationConfigStore,
+    ) -> None:
+        super().__init__(httpx_client, config_store)
+        self.batch_interval = int(os.getenv('PUSH_BATCH_INTERVAL_MS', '50')) / 1000
+        self.batch_max_events = int(os.getenv('PUSH_BATCH_MAX_EVENTS', '16'))
+        self._pending: Dict[str, Task] = {}
+        self._pending_events = 0
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def send_notification(self, task: Task) -> None:
+        """Queue a task update; the next flush delivers its latest snapshot."""
+        self._pending[task.id] = task
+        self._pending_events += 1
+
+        if self._pending_events >= self.batch_max_events:
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_interval())
+
+    async def _flush_after_interval(self) -> None:
+        await asyncio.sleep(self.batch_interval)
+        self._flush_task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Dispatch every pending task update now."""
+        if not self._pending:
+            return
+
+        batch = list(self._pending.values())
+        self._pending.clear()
+        self._pending_events = 0
+
+        results = await asyncio.gather(
+            *(BasePushNotificationSender.send_notification(self, task) for task in batch),
+            return_exceptions=True,
+        )
+        for task, result in zip(batch, results):
+            if isinstance(result, Exception):
+                logger.error("Push notification batch failed for task_id=%s: %s", task.id, result)
+
+    async def aclose(self) -> None:
+        """Cancel the pending timer and deliver anything still buffered."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush()
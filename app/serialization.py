@@ -0,0 +1,39 @@
+"""orjson-backed JSON helpers for payloads, and msgpack helpers for state snapshots."""
+
+from typing import Any
+
+import msgpack
+import orjson
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize a pydantic model or plain JSON-compatible data to UTF-8 bytes.
+
+    Values orjson cannot encode natively fall back to ``str``.
+    """
+    if hasattr(obj, 'model_dump'):
+        obj = obj.model_dump()
+    options = _OPTIONS | orjson.OPT_INDENT_2 if indent else _OPTIONS
+    return orjson.dumps(obj, default=str, option=options)
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON bytes or text."""
+    return orjson.loads(data)
+
+
+def packb(obj: Any) -> bytes:
+    """Encode a pydantic model or plain JSON-compatible data as msgpack."""
+    if hasattr(obj, 'model_dump'):
+        obj = obj.model_dump(mode='json')
+    return msgpack.packb(obj, use_bin_type=True)
+
+
+def unpackb(data: bytes) -> Any:
+    """Decode msgpack bytes produced by packb."""
+    return msgpack.unpackb(data, raw=False)
+
+
+__all__ = ['dumps', 'loads', 'packb', 'unpackb']
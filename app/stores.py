@@ -0,0 +1,95 @@
+import os
+import logging
+
+from cachetools import LRUCache
+
+from a2a.server.tasks import InMemoryPushNotificationConfigStore, InMemoryTaskStore
+from a2a.types import PushNotificationConfig, Task
+
+logger = logging.getLogger(__name__)
+
+
+class BatchEvictingLRUCache(LRUCache):
+    """LRU cache that frees a fraction of its entries at once when full.
+
+    cachetools calls popitem() once per slot it needs; dropping a batch of the
+    least recently used entries instead keeps a full cache from evicting on
+    every single insert.
+    """
+
+    def __init__(self, maxsize: int, evict_fraction: float = 0.1):
+        super().__init__(maxsize)
+        self.evict_batch = max(1, int(maxsize * evict_fraction))
+
+    def popitem(self):
+        item = super().popitem()
+        for _ in range(self.evict_batch - 1):
+            if not self:
+                break
+            super().popitem()
+        return item
+
+
+class LRUTaskStore(InMemoryTaskStore):
+    """Size-bounded in-memory task store.
+
+    Every operation completes without awaiting, so it is atomic on the event
+    loop and the base class's asyncio.Lock is not needed.
+    """
+
+    def __init__(self, maxsize: int | None = None) -> None:
+        super().__init__()
+        maxsize = maxsize or int(os.getenv('TASK_STORE_MAX', '10000'))
+        self.tasks = BatchEvictingLRUCache(maxsize)
+
+    async def save(self, task: Task) -> None:
+        self.tasks[task.id] = task
+
+    async def get(self, task_id: str) -> Task | None:
+        return self.tasks.get(task_id)
+
+    async def delete(self, task_id: str) -> None:
+        if self.tasks.pop(task_id, None) is None:
+            logger.warning('Attempted to delete nonexistent task with id: %s', task_id)
+
+
+class LRUPushNotificationConfigStore(InMemoryPushNotificationConfigStore):
+    """Size-bounded in-memory push notification config store (lock-free, see LRUTaskStore)."""
+
+    def __init__(self, maxsize: int | None = None) -> None:
+        super().__init__()
+        maxsize = maxsize or int(os.getenv('PUSH_CONFIG_STORE_MAX', '10000'))
+        self._push_notification_infos = BatchEvictingLRUCache(maxsize)
+
+    async def set_info(self, task_id: str, notification_config: PushNotificationConfig) -> None:
+        if notification_config.id is None:
+            notification_config.id = task_id
+
+        configs = self._push_notification_infos.get(task_id)
+        if configs is None:
+            self._push_notification_infos[task_id] = [notification_config]
+            return
+
+        configs[:] = [config for config in configs if config.id != notification_config.id]
+        configs.append(notification_config)
+
+    async def get_info(self, task_id: str) -> list[PushNotificationConfig]:
+        return self._push_notification_infos.get(task_id) or []
+
+    async def delete_info(self, task_id: str, config_id: str | None = None) -> None:
+        configs = self._push_notification_infos.get(task_id)
+        if not configs:
+            return
+
+        if config_id is None:
+            config_id = task_id
+        for config in configs:
+            if config.id == config_id:
+                configs.remove(config)
+                break
+
+        if not configs:
+            del self._push_notification_infos[task_id]
+
+
+__all__ = ['BatchEvictingLRUCache', 'LRUTaskStore', 'LRUPushNotificationConfigStore']
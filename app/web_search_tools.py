@@ -1,13 +1,207 @@
 import os
+import re
 import logging
-from typing import List, Dict, Any, Optional
-from langchain_core.tools import tool
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
+from cachetools import TTLCache
+from langchain_core.tools import BaseTool, tool
 from duckduckgo_search import DDGS
+from duckduckgo_search.exceptions import DuckDuckGoSearchException, RatelimitException
 import asyncio
-import httpx
+import random
+import threading
+import weakref
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# Read once at import; the tools check it on every call
+_WEB_SEARCH_ENABLED = os.getenv('ENABLE_WEB_SEARCH', 'true').lower() == 'true'
+
+# Known tech/education sites, matched as substrings of a lowercased URL
+_QUALITY_SITES_RE = re.compile('|'.join(map(re.escape, (
+    'medium.com', 'dev.to', 'hackernoon.com', 'freecodecamp.org',
+    'towards', 'github.com', 'interviewbit.com', 'geeksforgeeks.org'
+))))
+
+# Query templates per tool, keyed by the tool's type argument, with the
+# template used for any other value
+_LEARNING_QUERY_BY_TYPE = {
+    'courses': "{topic} {skill_level} online courses tutorial",
+    'books': "{topic} {skill_level} books programming",
+    'practice': "{topic} {skill_level} practice problems exercises",
+}
+_LEARNING_QUERY_DEFAULT = "{topic} {skill_level} learning resources tutorial practice"
+
+_LEETCODE_QUERIES = (
+    "site:leetcode.com {topic} {difficulty} problems",
+    "leetcode {topic} problem list {difficulty}",
+    "best leetcode {topic} problems {difficulty} interview",
+)
+
+_YOUTUBE_QUERY_BY_TYPE = {
+    'tutorial': "site:youtube.com {topic} tutorial programming interview",
+    'interview': "site:youtube.com {topic} mock interview coding",
+    'explanation': "site:youtube.com {topic} explained programming concepts",
+}
+_YOUTUBE_QUERY_DEFAULT = "site:youtube.com {topic} programming interview preparation"
+
+_GUIDE_QUERY_BY_TYPE = {
+    'comprehensive': "{domain} interview guide {year} complete preparation",
+    'quick': "{domain} interview cheat sheet {year} quick reference",
+    'roadmap': "{domain} interview roadmap {year} study plan",
+}
+_GUIDE_QUERY_DEFAULT = "{domain} interview tips {year} latest advice"
+
+_ddgs_local = threading.local()
+
+# Raw DDG results by normalized query, shared by every tool. Lookups happen on
+# worker threads, so the cache is guarded by a lock.
+_query_cache: TTLCache[Tuple, List[Dict[str, str]]] = TTLCache(
+    maxsize=int(os.getenv('QUERY_CACHE_MAX', '1024')),
+    ttl=int(os.getenv('SEARCH_CACHE_TTL_SECONDS', '21600')),
+)
+_query_cache_lock = threading.Lock()
+
+# Searches currently running, by query key, so concurrent callers asking the
+# same thing share one DDG request. Kept per event loop, since a task can only
+# be awaited from its own loop.
+_inflight_by_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple, asyncio.Task]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _query_key(keywords: str, **kwargs) -> Tuple:
+    return (keywords.strip().lower(), *sorted(kwargs.items()))
+
+
+def _ddgs_text(keywords: str, **kwargs) -> List[Dict[str, str]]:
+    """
+    Run DDGS.text() on the calling worker thread's client, through the query cache.
+
+    A DDGS instance keeps its HTTP session warm across calls, but it spaces out
+    its own requests with a blocking sleep and is not meant to be shared between
+    threads, so each executor thread reuses one instead of building a new one
+    per search.
+    """
+    key = _query_key(keywords, **kwargs)
+    with _query_cache_lock:
+        cached = _query_cache.get(key)
+    if cached is not None:
+        return cached
+
+    ddgs = getattr(_ddgs_local, 'ddgs', None)
+    if ddgs is None:
+        ddgs = _ddgs_local.ddgs = DDGS()
+    results = ddgs.text(keywords=keywords, **kwargs)
+
+    # Empty answers are not cached; they are usually transient
+    if results:
+        with _query_cache_lock:
+            _query_cache[key] = results
+    return results
+
+
+def _is_rate_limited(error: BaseException) -> bool:
+    # DDGS.text() re-raises backend failures wrapped in a plain DuckDuckGoSearchException
+    inner = error.args[0] if error.args else None
+    return isinstance(error, RatelimitException) or isinstance(inner, RatelimitException)
+
+
+class _AdaptiveLimiter:
+    """
+    Concurrency limit for DDG searches that adapts like TCP congestion control.
+
+    Each successful search widens the window by 1/window (about one slot per
+    window's worth of successes) up to the maximum, and a rate-limit error
+    halves it, down to the minimum.
+    """
+
+    def __init__(self, initial: int, minimum: int, maximum: int):
+        self.minimum = minimum
+        self.maximum = maximum
+        self._window = float(initial)
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._window)
+
+    async def __aenter__(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            if exc_type is None:
+                self._window = min(self.maximum, self._window + 1 / self._window)
+            elif _is_rate_limited(exc):
+                self._window = max(self.minimum, self._window / 2)
+                logger.warning("DDG rate limited; search concurrency reduced to %s", self.limit)
+            self._condition.notify_all()
+
+
+# One limiter per event loop: its Condition belongs to the loop that first
+# awaits it, so a limiter cannot be shared across loops
+_limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _AdaptiveLimiter]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _search_limiter() -> _AdaptiveLimiter:
+    loop = asyncio.get_running_loop()
+    limiter = _limiters.get(loop)
+    if limiter is None:
+        limiter = _limiters[loop] = _AdaptiveLimiter(
+            initial=int(os.getenv('SEARCH_INITIAL_CONCURRENCY', '4')),
+            minimum=1,
+            maximum=int(os.getenv('SEARCH_MAX_CONCURRENCY', '16')),
+        )
+    return limiter
+
+
+_SEARCH_ATTEMPTS = 3
+
+
+async def _limited_search(keywords: str, **kwargs) -> List[Dict[str, str]]:
+    # DDG errors are retried with exponential backoff (1s, 2s, plus jitter);
+    # the limiter slot is released while waiting
+    for attempt in range(_SEARCH_ATTEMPTS):
+        try:
+            async with _search_limiter():
+                return await asyncio.to_thread(_ddgs_text, keywords, **kwargs)
+        except DuckDuckGoSearchException as search_error:
+            if attempt == _SEARCH_ATTEMPTS - 1:
+                raise
+            delay = min(2 ** attempt, 4) + random.random() * 0.2
+            logger.warning("DDG search for '%s' failed (%s); retrying in %.1fs", keywords, search_error, delay)
+            await asyncio.sleep(delay)
+
+
+async def _search(keywords: str, **kwargs) -> List[Dict[str, str]]:
+    """
+    Run a DDG text search in a worker thread, within the adaptive concurrency limit.
+
+    A caller asking for a query that is already in flight awaits that search
+    instead of issuing its own; once it finishes, the query cache serves repeats.
+    """
+    key = _query_key(keywords, **kwargs)
+    inflight = _inflight_by_loop.setdefault(asyncio.get_running_loop(), {})
+    task = inflight.get(key)
+    if task is None:
+        task = inflight[key] = asyncio.ensure_future(_limited_search(keywords, **kwargs))
+
+        def _forget(done: asyncio.Task) -> None:
+            # Runs on completion, failure or cancellation alike
+            if inflight.get(key) is done:
+                del inflight[key]
+
+        task.add_done_callback(_forget)
+    # Shielded so one caller being cancelled does not cancel the others' search
+    return await asyncio.shield(task)
+
 
 @tool
 async def search_interview_resources(
@@ -28,41 +222,36 @@ async def search_interview_resources(
     """
     try:
         # Check if web search is enabled
-        if not os.getenv('ENABLE_WEB_SEARCH', 'true').lower() == 'true':
+        if not _WEB_SEARCH_ENABLED:
             return {
                 'success': False,
                 'error': 'Web search is disabled',
                 'results': []
             }
 
-        # Initialize DuckDuckGo search
-        ddgs = DDGS()
-
         # Enhance query with domain-specific terms
         enhanced_query = f"{query} {domain} interview preparation"
 
-        logger.info(f"Searching for: {enhanced_query}")
+        logger.debug("Searching for: %s", enhanced_query)
 
         # Perform search
         search_results = []
         try:
-            results = ddgs.text(
+            results = await _search(
                 keywords=enhanced_query,
                 max_results=max_results,
                 region='us-en',
                 safesearch='moderate'
             )
 
-            for result in results:
-                search_results.append({
-                    'title': result.get('title', ''),
-                    'snippet': result.get('body', ''),
-                    'url': result.get('href', ''),
-                    'domain': domain
-                })
+            # Arguments are echoed once on the response, not on every row
+            search_results = [
+                {'title': r.get('title', ''), 'snippet': r.get('body', ''), 'url': r.get('href', '')}
+                for r in results
+            ]
 
         except Exception as search_error:
-            logger.error(f"DuckDuckGo search failed: {search_error}")
+            logger.error("DuckDuckGo search failed: %s", search_error)
             return {
                 'success': False,
                 'error': f'Search failed: {str(search_error)}',
@@ -78,7 +267,7 @@ async def search_interview_resources(
         }
 
     except Exception as e:
-        logger.error(f"Search tool error: {e}")
+        logger.error("Search tool error: %s", e)
         return {
             'success': False,
             'error': str(e),
@@ -102,40 +291,35 @@ async def search_company_interview_info(
         Dictionary containing company interview information
     """
     try:
-        if not os.getenv('ENABLE_WEB_SEARCH', 'true').lower() == 'true':
+        if not _WEB_SEARCH_ENABLED:
             return {
                 'success': False,
                 'error': 'Web search is disabled',
                 'results': []
             }
 
-        ddgs = DDGS()
-
         # Search for company-specific interview info
         query = f"{company_name} {role_type} interview questions process experience"
 
-        logger.info(f"Searching company info for: {query}")
+        logger.debug("Searching company info for: %s", query)
 
         search_results = []
         try:
-            results = ddgs.text(
+            results = await _search(
                 keywords=query,
                 max_results=5,
                 region='us-en',
                 safesearch='moderate'
             )
 
-            for result in results:
-                search_results.append({
-                    'title': result.get('title', ''),
-                    'snippet': result.get('body', ''),
-                    'url': result.get('href', ''),
-                    'company': company_name,
-                    'role_type': role_type
-                })
+            # Arguments are echoed once on the response, not on every row
+            search_results = [
+                {'title': r.get('title', ''), 'snippet': r.get('body', ''), 'url': r.get('href', '')}
+                for r in results
+            ]
 
         except Exception as search_error:
-            logger.error(f"Company search failed: {search_error}")
+            logger.error("Company search failed: %s", search_error)
             return {
                 'success': False,
                 'error': f'Company search failed: {str(search_error)}',
@@ -152,7 +336,7 @@ async def search_company_interview_info(
         }
 
     except Exception as e:
-        logger.error(f"Company search tool error: {e}")
+        logger.error("Company search tool error: %s", e)
         return {
             'success': False,
             'error': str(e),
@@ -178,48 +362,36 @@ async def search_learning_resources(
         Dictionary containing learning resources
     """
     try:
-        if not os.getenv('ENABLE_WEB_SEARCH', 'true').lower() == 'true':
+        if not _WEB_SEARCH_ENABLED:
             return {
                 'success': False,
                 'error': 'Web search is disabled',
                 'results': []
             }
 
-        ddgs = DDGS()
-
         # Build search query based on resource type
-        if resource_type == "courses":
-            query = f"{topic} {skill_level} online courses tutorial"
-        elif resource_type == "books":
-            query = f"{topic} {skill_level} books programming"
-        elif resource_type == "practice":
-            query = f"{topic} {skill_level} practice problems exercises"
-        else:
-            query = f"{topic} {skill_level} learning resources tutorial practice"
+        template = _LEARNING_QUERY_BY_TYPE.get(resource_type, _LEARNING_QUERY_DEFAULT)
+        query = template.format(topic=topic, skill_level=skill_level)
 
-        logger.info(f"Searching learning resources for: {query}")
+        logger.debug("Searching learning resources for: %s", query)
 
         search_results = []
         try:
-            results = ddgs.text(
+            results = await _search(
                 keywords=query,
                 max_results=6,
                 region='us-en',
                 safesearch='moderate'
             )
 
-            for result in results:
-                search_results.append({
-                    'title': result.get('title', ''),
-                    'snippet': result.get('body', ''),
-                    'url': result.get('href', ''),
-                    'topic': topic,
-                    'skill_level': skill_level,
-                    'resource_type': resource_type
-                })
+            # Arguments are echoed once on the response, not on every row
+            search_results = [
+                {'title': r.get('title', ''), 'snippet': r.get('body', ''), 'url': r.get('href', '')}
+                for r in results
+            ]
 
         except Exception as search_error:
-            logger.error(f"Learning resources search failed: {search_error}")
+            logger.error("Learning resources search failed: %s", search_error)
             return {
                 'success': False,
                 'error': f'Learning resources search failed: {str(search_error)}',
@@ -237,7 +409,7 @@ async def search_learning_resources(
         }
 
     except Exception as e:
-        logger.error(f"Learning resources search tool error: {e}")
+        logger.error("Learning resources search tool error: %s", e)
         return {
             'success': False,
             'error': str(e),
@@ -245,6 +417,55 @@ async def search_learning_resources(
         }
 
 
+async def aiter_leetcode_problems(
+    topic: str,
+    difficulty: str = "medium",
+    max_results: int = 10
+) -> AsyncIterator[Dict[str, str]]:
+    """
+    Yield unique LeetCode result rows as the sub-queries complete.
+
+    The three sibling queries run concurrently and rows are yielded in arrival
+    order, deduped by URL, stopping once max_results rows have been produced.
+    Queries still in flight when the consumer stops are cancelled.
+    """
+    queries = [template.format(topic=topic, difficulty=difficulty) for template in _LEETCODE_QUERIES]
+
+    async def run_query(query: str) -> List[Dict[str, Any]]:
+        logger.debug("Searching LeetCode problems: %s", query)
+        try:
+            return await _search(
+                keywords=query,
+                max_results=max_results // len(queries) + 2,
+                region='us-en',
+                safesearch='moderate'
+            )
+        except Exception as search_error:
+            logger.error("LeetCode search failed for query '%s': %s", query, search_error)
+            return []
+
+    tasks = [asyncio.create_task(run_query(query)) for query in queries]
+    seen_urls = set()
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            for result in await next_done:
+                url = result.get('href', '')
+                if url in seen_urls:
+                    continue
+                if 'leetcode.com' in url.lower() or 'leetcode' in result.get('title', '').lower():
+                    seen_urls.add(url)
+                    yield {
+                        'title': result.get('title', ''),
+                        'snippet': result.get('body', ''),
+                        'url': url
+                    }
+                    if len(seen_urls) >= max_results:
+                        return
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
 @tool
 async def search_leetcode_problems(
     topic: str,
@@ -263,71 +484,28 @@ async def search_leetcode_problems(
         Dictionary containing LeetCode problem information
     """
     try:
-        if not os.getenv('ENABLE_WEB_SEARCH', 'true').lower() == 'true':
+        if not _WEB_SEARCH_ENABLED:
             return {
                 'success': False,
                 'error': 'Web search is disabled',
                 'results': []
             }
 
-        ddgs = DDGS()
-
-        # Create specific LeetCode search queries
-        queries = [
-            f"site:leetcode.com {topic} {difficulty} problems",
-            f"leetcode {topic} problem list {difficulty}",
-            f"best leetcode {topic} problems {difficulty} interview"
+        unique_results = [
+            row async for row in aiter_leetcode_problems(topic, difficulty, max_results)
         ]
 
-        all_results = []
-
-        for query in queries:
-            logger.info(f"Searching LeetCode problems: {query}")
-            try:
-                results = ddgs.text(
-                    keywords=query,
-                    max_results=max_results // len(queries) + 2,
-                    region='us-en',
-                    safesearch='moderate'
-                )
-
-                for result in results:
-                    if 'leetcode.com' in result.get('href', '').lower() or 'leetcode' in result.get('title', '').lower():
-                        all_results.append({
-                            'title': result.get('title', ''),
-                            'snippet': result.get('body', ''),
-                            'url': result.get('href', ''),
-                            'topic': topic,
-                            'difficulty': difficulty,
-                            'platform': 'leetcode'
-                        })
-
-                await asyncio.sleep(0.5)  # Be respectful to search service
-
-            except Exception as search_error:
-                logger.error(f"LeetCode search failed for query '{query}': {search_error}")
-                continue
-
-        # Remove duplicates based on URL
-        seen_urls = set()
-        unique_results = []
-        for result in all_results:
-            if result['url'] not in seen_urls:
-                seen_urls.add(result['url'])
-                unique_results.append(result)
-                if len(unique_results) >= max_results:
-                    break
-
         return {
             'success': True,
             'topic': topic,
             'difficulty': difficulty,
-            'results': unique_results[:max_results],
+            'platform': 'leetcode',
+            'results': unique_results,
             'total_results': len(unique_results)
         }
 
     except Exception as e:
-        logger.error(f"LeetCode search tool error: {e}")
+        logger.error("LeetCode search tool error: %s", e)
         return {
             'success': False,
             'error': str(e),
@@ -353,49 +531,36 @@ async def search_youtube_channels(
         Dictionary containing YouTube channel and video information
     """
     try:
-        if not os.getenv('ENABLE_WEB_SEARCH', 'true').lower() == 'true':
+        if not _WEB_SEARCH_ENABLED:
             return {
                 'success': False,
                 'error': 'Web search is disabled',
                 'results': []
             }
 
-        ddgs = DDGS()
-
         # Create YouTube-specific search queries
-        if content_type == "tutorial":
-            query = f"site:youtube.com {topic} tutorial programming interview"
-        elif content_type == "interview":
-            query = f"site:youtube.com {topic} mock interview coding"
-        elif content_type == "explanation":
-            query = f"site:youtube.com {topic} explained programming concepts"
-        else:
-            query = f"site:youtube.com {topic} programming interview preparation"
+        template = _YOUTUBE_QUERY_BY_TYPE.get(content_type, _YOUTUBE_QUERY_DEFAULT)
+        query = template.format(topic=topic)
 
-        logger.info(f"Searching YouTube content: {query}")
+        logger.debug("Searching YouTube content: %s", query)
 
         search_results = []
         try:
-            results = ddgs.text(
+            results = await _search(
                 keywords=query,
                 max_results=max_results,
                 region='us-en',
                 safesearch='moderate'
             )
 
-            for result in results:
-                if 'youtube.com' in result.get('href', ''):
-                    search_results.append({
-                        'title': result.get('title', ''),
-                        'snippet': result.get('body', ''),
-                        'url': result.get('href', ''),
-                        'topic': topic,
-                        'content_type': content_type,
-                        'platform': 'youtube'
-                    })
+            # Arguments are echoed once on the response, not on every row
+            search_results = [
+                {'title': r.get('title', ''), 'snippet': r.get('body', ''), 'url': r['href']}
+                for r in results if 'youtube.com' in r.get('href', '')
+            ]
 
         except Exception as search_error:
-            logger.error(f"YouTube search failed: {search_error}")
+            logger.error("YouTube search failed: %s", search_error)
             return {
                 'success': False,
                 'error': f'YouTube search failed: {str(search_error)}',
@@ -407,12 +572,13 @@ async def search_youtube_channels(
             'query': query,
             'topic': topic,
             'content_type': content_type,
+            'platform': 'youtube',
             'results': search_results,
             'total_results': len(search_results)
         }
 
     except Exception as e:
-        logger.error(f"YouTube search tool error: {e}")
+        logger.error("YouTube search tool error: %s", e)
         return {
             'success': False,
             'error': str(e),
@@ -438,58 +604,43 @@ async def search_current_interview_guides(
         Dictionary containing current interview guide information
     """
     try:
-        if not os.getenv('ENABLE_WEB_SEARCH', 'true').lower() == 'true':
+        if not _WEB_SEARCH_ENABLED:
             return {
                 'success': False,
                 'error': 'Web search is disabled',
                 'results': []
             }
 
-        ddgs = DDGS()
-
         # Create queries for current guides
         domain_clean = domain.replace('_', ' ')
+        template = _GUIDE_QUERY_BY_TYPE.get(guide_type, _GUIDE_QUERY_DEFAULT)
+        query = template.format(domain=domain_clean, year=year)
 
-        if guide_type == "comprehensive":
-            query = f"{domain_clean} interview guide {year} complete preparation"
-        elif guide_type == "quick":
-            query = f"{domain_clean} interview cheat sheet {year} quick reference"
-        elif guide_type == "roadmap":
-            query = f"{domain_clean} interview roadmap {year} study plan"
-        else:
-            query = f"{domain_clean} interview tips {year} latest advice"
-
-        logger.info(f"Searching current guides: {query}")
+        logger.debug("Searching current guides: %s", query)
 
         search_results = []
         try:
-            results = ddgs.text(
+            results = await _search(
                 keywords=query,
                 max_results=8,
                 region='us-en',
                 safesearch='moderate'
             )
 
-            for result in results:
-                # Prioritize results from known tech/education sites
-                url = result.get('href', '').lower()
-                is_quality_site = any(site in url for site in [
-                    'medium.com', 'dev.to', 'hackernoon.com', 'freecodecamp.org',
-                    'towards', 'github.com', 'interviewbit.com', 'geeksforgeeks.org'
-                ])
-
-                search_results.append({
-                    'title': result.get('title', ''),
-                    'snippet': result.get('body', ''),
-                    'url': result.get('href', ''),
-                    'domain': domain,
-                    'year': year,
-                    'guide_type': guide_type,
-                    'is_quality_site': is_quality_site
-                })
+            # Prioritize results from known tech/education sites; the arguments
+            # are echoed once on the response, not on every row
+            search_results = [
+                {
+                    'title': r.get('title', ''),
+                    'snippet': r.get('body', ''),
+                    'url': r.get('href', ''),
+                    'is_quality_site': _QUALITY_SITES_RE.search(r.get('href', '').lower()) is not None
+                }
+                for r in results
+            ]
 
         except Exception as search_error:
-            logger.error(f"Current guides search failed: {search_error}")
+            logger.error("Current guides search failed: %s", search_error)
             return {
                 'success': False,
                 'error': f'Current guides search failed: {str(search_error)}',
@@ -510,7 +661,7 @@ async def search_current_interview_guides(
         }
 
     except Exception as e:
-        logger.error(f"Current guides search tool error: {e}")
+        logger.error("Current guides search tool error: %s", e)
         return {
             'success': False,
             'error': str(e),
@@ -518,12 +669,146 @@ async def search_current_interview_guides(
         }
 
 
+@lru_cache(maxsize=256)
+def _domain_search_payloads(
+    domain: str,
+    skill_level: str,
+    max_results: int
+) -> Tuple[Tuple[BaseTool, Dict[str, Any]], ...]:
+    """
+    Build the (tool, input) pairs searched for one domain, in result order.
+
+    The inputs are shared between calls and must not be mutated; ainvoke only
+    reads them.
+    """
+    payloads = [
+        # Domain-specific interview resources
+        (search_interview_resources, {
+            'query': f"{domain} interview preparation guide",
+            'domain': domain,
+            'max_results': max_results
+        }),
+        # Learning resources
+        (search_learning_resources, {
+            'topic': domain,
+            'skill_level': skill_level,
+            'resource_type': "all"
+        }),
+        # Current interview guides
+        (search_current_interview_guides, {
+            'domain': domain,
+            'year': "2024",
+            'guide_type': "comprehensive"
+        }),
+        # YouTube content
+        (search_youtube_channels, {
+            'topic': domain,
+            'content_type': "tutorial",
+            'max_results': 6
+        }),
+    ]
+
+    # For algorithms domain, search for LeetCode problems
+    if domain == 'algorithms':
+        difficulty = 'easy' if skill_level == 'beginner' else 'medium' if skill_level == 'intermediate' else 'hard'
+        payloads.append((search_leetcode_problems, {
+            'topic': "algorithms data structures",
+            'difficulty': difficulty,
+            'max_results': 8
+        }))
+
+    return tuple(payloads)
+
+
 class WebSearchManager:
     """Manager class for coordinating web searches during interview prep planning."""
 
     def __init__(self):
         self.search_enabled = os.getenv('ENABLE_WEB_SEARCH', 'true').lower() == 'true'
         self.max_results = int(os.getenv('SEARCH_RESULTS_LIMIT', '5'))
+        self.max_concurrent_domains = int(os.getenv('SEARCH_MAX_CONCURRENT_DOMAINS', '5'))
+        # Domain research shared across conversations, keyed by (domain, skill level).
+        # The per-key locks make concurrent misses for one key search only once;
+        # each lock is dropped once no caller holds or waits on it.
+        self._domain_cache: TTLCache[Tuple[str, str], Dict[str, Any]] = TTLCache(
+            maxsize=int(os.getenv('SEARCH_CACHE_MAX', '256')),
+            ttl=int(os.getenv('SEARCH_CACHE_TTL_SECONDS', '21600')),
+        )
+        self._domain_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self._domain_lock_users: Dict[Tuple[str, str], int] = {}
+
+    async def _research_domain(
+        self,
+        domain: str,
+        skill_level: str,
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """Run all searches for a single domain concurrently."""
+        async with semaphore:
+            logger.info("Researching domain: %s", domain)
+
+            searches = [
+                search.ainvoke(payload)
+                for search, payload in _domain_search_payloads(domain, skill_level, self.max_results)
+            ]
+
+            results = await asyncio.gather(*searches)
+            domain_results, learning_results, current_guides, youtube_results = results[:4]
+            leetcode_results = results[4] if len(results) > 4 else None
+
+            return {
+                'interview_info': domain_results,
+                'learning_resources': learning_results,
+                'current_guides': current_guides,
+                'youtube_resources': youtube_results,
+                'leetcode_problems': leetcode_results
+            }
+
+    async def _research_company(self, company: str, semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        """Research interview info for one company, within the shared concurrency cap."""
+        async with semaphore:
+            logger.info("Researching company: %s", company)
+
+            return await search_company_interview_info.ainvoke({
+                'company_name': company,
+                'role_type': "software engineer"
+            })
+
+    async def _cached_research_domain(
+        self,
+        domain: str,
+        skill_level: str,
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """Return cached research for a domain, running the searches on a miss.
+
+        Cached results are shared between callers and must not be mutated.
+        """
+        key = (domain, skill_level)
+        cached = self._domain_cache.get(key)
+        if cached is not None:
+            return cached
+
+        lock = self._domain_locks.setdefault(key, asyncio.Lock())
+        self._domain_lock_users[key] = self._domain_lock_users.get(key, 0) + 1
+        try:
+            async with lock:
+                cached = self._domain_cache.get(key)
+                if cached is None:
+                    cached = await self._research_domain(domain, skill_level, semaphore)
+                    # Only keep complete results; failed searches are retried next time
+                    if all(result is None or result.get('success') for result in cached.values()):
+                        self._domain_cache[key] = cached
+                return cached
+        finally:
+            # A released lock may still have a woken waiter queued to acquire
+            # it, so it is only dropped when the last user leaves
+            users = self._domain_lock_users[key] - 1
+            if users:
+                self._domain_lock_users[key] = users
+            else:
+                del self._domain_lock_users[key]
+                del self._domain_locks[key]
 
     async def comprehensive_research(
         self,
@@ -558,71 +843,24 @@ class WebSearchManager:
         }
 
         try:
-            # Research each domain comprehensively
-            for domain in domains:
-                logger.info(f"Researching domain: {domain}")
-
-                # Search for domain-specific interview resources
-                domain_results = await search_interview_resources(
-                    query=f"{domain} interview preparation guide",
-                    domain=domain,
-                    max_results=self.max_results
-                )
-
-                # Search for learning resources
-                learning_results = await search_learning_resources(
-                    topic=domain,
-                    skill_level=skill_level,
-                    resource_type="all"
-                )
-
-                # Search for current interview guides
-                current_guides = await search_current_interview_guides(
-                    domain=domain,
-                    year="2024",
-                    guide_type="comprehensive"
-                )
-
-                # Search for YouTube content
-                youtube_results = await search_youtube_channels(
-                    topic=domain,
-                    content_type="tutorial",
-                    max_results=6
-                )
-
-                # For algorithms domain, search for LeetCode problems
-                leetcode_results = None
-                if domain == 'algorithms':
-                    difficulty = 'easy' if skill_level == 'beginner' else 'medium' if skill_level == 'intermediate' else 'hard'
-                    leetcode_results = await search_leetcode_problems(
-                        topic="algorithms data structures",
-                        difficulty=difficulty,
-                        max_results=8
-                    )
-
-                research_data['domains'][domain] = {
-                    'interview_info': domain_results,
-                    'learning_resources': learning_results,
-                    'current_guides': current_guides,
-                    'youtube_resources': youtube_results,
-                    'leetcode_problems': leetcode_results
-                }
-
-                # Add small delay to be respectful to search service
-                await asyncio.sleep(1)
-
-            # Research companies if provided
-            if companies:
-                for company in companies:
-                    logger.info(f"Researching company: {company}")
-
-                    company_results = await search_company_interview_info(
-                        company_name=company,
-                        role_type="software engineer"
-                    )
-
-                    research_data['companies'][company] = company_results
-                    await asyncio.sleep(1)
+            # Research domains and any companies concurrently, sharing one cap to
+            # avoid bursting the search service
+            semaphore = asyncio.Semaphore(self.max_concurrent_domains)
+            companies = companies or []
+            domain_results, company_results = await asyncio.gather(
+                asyncio.gather(
+                    *(self._cached_research_domain(domain, skill_level, semaphore) for domain in domains)
+                ),
+                asyncio.gather(
+                    *(self._research_company(company, semaphore) for company in companies)
+                ),
+            )
+            research_data['domains'] = dict(zip(domains, domain_results))
+            research_data['companies'] = dict(zip(companies, company_results))
+            logger.info(
+                "Researched %d domains and %d companies for %s level",
+                len(domains), len(companies), skill_level
+            )
 
             return {
                 'success': True,
@@ -632,7 +870,7 @@ class WebSearchManager:
             }
 
         except Exception as e:
-            logger.error(f"Comprehensive research failed: {e}")
+            logger.error("Comprehensive research failed: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -8,29 +8,116 @@ the raw responses to verify correct A2A format and functionality.
 
 import asyncio
 import json
+import os
+import sys
 import uuid
 import httpx
 import time
+from functools import lru_cache
 from typing import Dict, Any, Optional
 import logging
 
+# orjson is preferred; ujson and then the stdlib cover platforms without an
+# orjson wheel
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# A2A_VERBOSE=false drops send_message's request/response dumps (errors are
+# still shown), and JSON is only indented when stdout is a terminal
+_VERBOSE = os.getenv('A2A_VERBOSE', 'true').lower() == 'true'
+_INDENT_JSON = sys.stdout.isatty()
+
+# Turns of the standard multi-turn flow, from greeting to a plan request
+CONVERSATION_QUERIES = [
+    "I want to prepare for software engineering interviews",
+    "I want to focus on algorithms and system design",
+    "I'm at an intermediate level",
+    "I prefer a balanced approach"
+]
+
+
+def _pretty_json(obj: Any) -> str:
+    """Format JSON-compatible data for the console, indented on a terminal."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if _INDENT_JSON else 0).decode()
+    if ujson is not None:
+        return ujson.dumps(obj, indent=2 if _INDENT_JSON else 0, ensure_ascii=False, escape_forward_slashes=False)
+    return json.dumps(obj, indent=2 if _INDENT_JSON else None, ensure_ascii=False)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a request body to compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    if ujson is not None:
+        return ujson.dumps(obj, ensure_ascii=False).encode()
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Parse a JSON response body; raises ValueError if it is not valid JSON."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if ujson is not None:
+        return ujson.loads(data)
+    return json.loads(data)
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create an HTTP client that several test clients can share.
+
+    The pool is sized for parallel conversations and benchmark runs, so
+    concurrent requests reuse warm connections. HTTP/2 is negotiated over TLS;
+    against the plain-http dev server connections are reused over HTTP/1.1.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=50, keepalive_expiry=120.0),
+    )
+
+
+@lru_cache(maxsize=8)
+def _build_push_config(url: str, token: str = "test-webhook-token") -> Dict[str, Any]:
+    """Push notification config for a webhook, built once per URL and token.
+
+    The dict is shared between requests and must not be mutated.
+    """
+    return {
+        "url": url,
+        "token": token,
+        "authentication": {
+            "schemes": ["Bearer"]
+        }
+    }
+
 
 class A2ATestClient:
     """Test client for A2A Interview Preparation Agent."""
 
-    def __init__(self, base_url: str = "http://localhost:10001"):
+    def __init__(self, base_url: str = "http://localhost:10001", client: Optional[httpx.AsyncClient] = None):
+        """Use the given HTTP client if one is passed; it is left open by close()."""
         self.base_url = base_url.rstrip('/')
-        self.client = httpx.AsyncClient(timeout=30.0)
-        self.context_id = str(uuid.uuid4())
-        self.session_id = str(uuid.uuid4())
+        self._owns_client = client is None
+        self.client = client or create_http_client()
+        self.context_id = uuid.uuid4().hex
+        self.session_id = uuid.uuid4().hex
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Close the HTTP client, unless it was passed in."""
+        if self._owns_client:
+            await self.client.aclose()
 
     def _create_message_request(
         self,
@@ -41,7 +128,7 @@ class A2ATestClient:
     ) -> Dict[str, Any]:
         """Create an A2A message/send request."""
 
-        message_id = str(uuid.uuid4())
+        message_id = uuid.uuid4().hex
         context_id = context_id or self.context_id
 
         message_data = {
@@ -67,7 +154,7 @@ class A2ATestClient:
             "params": {
                 "message": message_data
             },
-            "id": str(uuid.uuid4())
+            "id": uuid.uuid4().hex
         }
 
         # Add push notification configuration if provided
@@ -90,44 +177,61 @@ class A2ATestClient:
 
         request = self._create_message_request(query, task_id, context_id, push_notification_config)
 
-        print(f"\n📤 SENDING REQUEST:")
-        print("=" * 60)
-        print(json.dumps(request, indent=2))
+        # Each block is written with one print rather than a print per line
+        if _VERBOSE:
+            print("\n".join(("\n📤 SENDING REQUEST:", "=" * 60, _pretty_json(request))))
 
+        lines = []
         try:
-            start_time = time.time()
-            response = await self.client.post(
+            # Monotonic, nanosecond-resolution clock for sub-millisecond localhost timings
+            start_ns = time.perf_counter_ns()
+            # Encoded here rather than with json=, which would run httpx's stdlib encoder.
+            # Streamed so the time to the response headers is measured separately
+            # from reading the body.
+            async with self.client.stream(
+                "POST",
                 f"{self.base_url}/",
-                json=request,
+                content=_dumps(request),
                 headers={"Content-Type": "application/json"}
-            )
-            end_time = time.time()
-
-            print(f"\n📥 RESPONSE (took {end_time - start_time:.2f}s):")
-            print("=" * 60)
-            print(f"Status Code: {response.status_code}")
-            print(f"Headers: {dict(response.headers)}")
+            ) as response:
+                headers_ms = (time.perf_counter_ns() - start_ns) / 1e6
+                body = await response.aread()
+            elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+            if _VERBOSE:
+                lines += (
+                    f"\n📥 RESPONSE (took {elapsed_ms:.3f}ms, headers after {headers_ms:.3f}ms):",
+                    "=" * 60,
+                    f"Status Code: {response.status_code}",
+                )
 
             if show_raw:
-                print(f"\nRaw Response Body:")
-                response_text = response.text
-                print(response_text)
+                # JSON-RPC bodies are UTF-8; decode the bytes once for display
+                # and parse the same bytes, rather than going through response.text
+                response_text = body.decode('utf-8', 'replace')
+                if _VERBOSE:
+                    lines += (f"Headers: {dict(response.headers)}", "\nRaw Response Body:", response_text)
 
                 # Try to parse and pretty print JSON
                 try:
-                    response_json = response.json()
-                    print(f"\nParsed JSON Response:")
-                    print(json.dumps(response_json, indent=2))
+                    response_json = _loads(body)
+                    if _VERBOSE:
+                        lines += ("\nParsed JSON Response:", _pretty_json(response_json))
                     return response_json
-                except json.JSONDecodeError:
-                    print("⚠️  Response is not valid JSON")
+                except ValueError:
+                    lines.append("⚠️  Response is not valid JSON")
                     return {"error": "Invalid JSON response", "raw": response_text}
+            elif response.headers.get('content-type', '').startswith('application/json'):
+                return _loads(body)
             else:
-                return response.json() if response.headers.get('content-type', '').startswith('application/json') else {"raw": response.text}
+                return {"raw": body.decode('utf-8', 'replace')}
 
         except Exception as e:
-            print(f"❌ Error sending request: {e}")
+            lines.append(f"❌ Error sending request: {e}")
             return {"error": str(e)}
+        finally:
+            if lines:
+                print("\n".join(lines))
 
     async def get_agent_info(self) -> Dict[str, Any]:
         """Get agent information by sending a test message to see capabilities."""
@@ -183,17 +287,10 @@ class A2ATestClient:
         print("\n🗣️  TESTING MULTI-TURN CONVERSATION FLOW")
         print("=" * 80)
 
-        conversation_queries = [
-            "I want to prepare for software engineering interviews",
-            "I want to focus on algorithms and system design",
-            "I'm at an intermediate level",
-            "I prefer a balanced approach"
-        ]
-
         responses = []
         current_context_id = self.context_id
 
-        for i, query in enumerate(conversation_queries, 1):
+        for i, query in enumerate(CONVERSATION_QUERIES, 1):
             print(f"\n🔄 TURN {i}: {query}")
             print("-" * 50)
 
@@ -214,19 +311,68 @@ class A2ATestClient:
 
         return responses
 
+    async def test_parallel_conversations(self, conversations: int = 4):
+        """
+        Run several independent multi-turn conversations concurrently.
+
+        Turns within one conversation depend on the previous answer and stay
+        sequential; separate contexts share no state, so they overlap.
+        """
+        print(f"\n🔀 TESTING {conversations} PARALLEL CONVERSATIONS")
+        print("=" * 80)
+
+        async def run_conversation(context_id: str):
+            return [
+                await self.send_message(query=query, context_id=context_id, show_raw=False)
+                for query in CONVERSATION_QUERIES
+            ]
+
+        start_time = time.perf_counter()
+        results = await asyncio.gather(
+            *(run_conversation(uuid.uuid4().hex) for _ in range(conversations))
+        )
+        elapsed = time.perf_counter() - start_time
+
+        print(f"\n✅ {conversations} conversations x {len(CONVERSATION_QUERIES)} turns took {elapsed:.2f}s")
+        return results
+
+    async def bench(self, query: str = "Hello, I need help with interview preparation", n: int = 20):
+        """
+        Send n concurrent requests and report each latency as it completes.
+
+        Every request opens its own context, so they do not race on one
+        conversation's state. Run with A2A_VERBOSE=false to keep the
+        per-request dumps out of the timings.
+        """
+        print(f"\n⏱️  BENCHMARKING {n} REQUESTS")
+        print("=" * 80)
+
+        async def timed_send(context_id: str):
+            start_ns = time.perf_counter_ns()
+            response = await self.send_message(query, context_id=context_id, show_raw=False)
+            return (time.perf_counter_ns() - start_ns) / 1e6, response
+
+        latencies = []
+        errors = 0
+        start_time = time.perf_counter()
+        for i, next_done in enumerate(asyncio.as_completed([timed_send(uuid.uuid4().hex) for _ in range(n)]), 1):
+            latency_ms, response = await next_done
+            latencies.append(latency_ms)
+            errors += 'error' in response
+            print(f"   #{i}: {latency_ms:.1f}ms")
+        elapsed = time.perf_counter() - start_time
+
+        latencies.sort()
+        print(f"\n📊 {n} requests in {elapsed:.2f}s ({n / elapsed:.1f} req/s), {errors} errors")
+        print(f"   p50: {latencies[(n - 1) // 2]:.1f}ms  p95: {latencies[int(0.95 * (n - 1))]:.1f}ms  max: {latencies[-1]:.1f}ms")
+        return latencies
+
     async def test_with_push_notifications(self, webhook_url: str = "http://localhost:8080/webhook"):
         """Test with push notification configuration."""
         print(f"\n🔔 TESTING WITH PUSH NOTIFICATIONS")
         print("=" * 80)
 
-        # Create push notification config
-        push_config = {
-            "url": webhook_url,
-            "token": "test-webhook-token",
-            "authentication": {
-                "schemes": ["Bearer"]
-            }
-        }
+        push_config = _build_push_config(webhook_url)
 
         # Send a query that should trigger async processing
         query = "I want algorithms and system design prep, intermediate level, balanced approach"
@@ -290,6 +436,11 @@ class A2ATestClient:
             logger.error(f"Test failed: {e}", exc_info=True)
 
 
+async def ainput(prompt: str = "") -> str:
+    """Read a line from stdin in a worker thread so the event loop keeps running."""
+    return await asyncio.to_thread(input, prompt)
+
+
 async def main():
     """Main test function with interactive options."""
     print("🧪 A2A Interview Preparation Agent Test Client")
@@ -316,46 +467,50 @@ async def main():
             print("4. Test with Push Notifications")
             print("5. Run Comprehensive Test")
             print("6. Custom Query")
+            print("7. Test Parallel Conversations")
+            print("8. Benchmark N Requests")
             print("0. Exit")
 
-            choice = input(f"\nChoose an option (0-6): ").strip()
+            choice = (await ainput(f"\nChoose an option (0-8): ")).strip()
 
             if choice == "0":
                 break
             elif choice == "1":
                 await client.get_agent_info()
             elif choice == "2":
-                query = input("Enter your message: ").strip()
+                query = (await ainput("Enter your message: ")).strip()
                 if query:
                     await client.send_message(query)
             elif choice == "3":
                 await client.test_multi_turn_conversation()
             elif choice == "4":
-                webhook_url = input("Enter webhook URL (or press Enter for default): ").strip()
+                webhook_url = (await ainput("Enter webhook URL (or press Enter for default): ")).strip()
                 if not webhook_url:
                     webhook_url = "http://localhost:8080/webhook"
                 await client.test_with_push_notifications(webhook_url)
             elif choice == "5":
                 await client.run_comprehensive_test()
             elif choice == "6":
-                query = input("Enter custom query: ").strip()
-                context_id = input("Enter context ID (or press Enter for new): ").strip()
+                query = (await ainput("Enter custom query: ")).strip()
+                context_id = (await ainput("Enter context ID (or press Enter for new): ")).strip()
                 if not context_id:
-                    context_id = str(uuid.uuid4())
+                    context_id = uuid.uuid4().hex
 
                 # Ask about push notifications
-                push_choice = input("Include push notifications? (y/n): ").strip().lower()
+                push_choice = (await ainput("Include push notifications? (y/n): ")).strip().lower()
                 push_config = None
                 if push_choice == 'y':
-                    webhook_url = input("Webhook URL: ").strip()
+                    webhook_url = (await ainput("Webhook URL: ")).strip()
                     if webhook_url:
-                        push_config = {
-                            "url": webhook_url,
-                            "token": "test-token",
-                            "authentication": {"schemes": ["Bearer"]}
-                        }
+                        push_config = _build_push_config(webhook_url, token="test-token")
 
                 await client.send_message(query, context_id=context_id, push_notification_config=push_config)
+            elif choice == "7":
+                count = (await ainput("Number of conversations (or press Enter for 4): ")).strip()
+                await client.test_parallel_conversations(int(count) if count.isdigit() else 4)
+            elif choice == "8":
+                count = (await ainput("Number of requests (or press Enter for 20): ")).strip()
+                await client.bench(n=int(count) if count.isdigit() and int(count) > 0 else 20)
             else:
                 print("Invalid option. Please try again.")
 